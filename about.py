@@ -1,76 +1,168 @@
 import tkinter as tk
 from tkinter import ttk
+from tkinter import font as tkfont
 from theme import *
-import webbrowser
-from ttkbootstrap_icons_fa.icon import FAIcon
+
+# (icon name, caption, FontAwesome style) for the "Built with" row
+TECH_ICONS = (
+    ("python", "Python", 'brands'),
+    ("window-maximize", "Tkinter", None),
+    ("brain", "Fuzzy Logic", None),
+)
+
+
+HOMEPAGE_URL = "https://fldr.xyz"
+
+# Label presets -> ttk styles defined in theme.STYLE_SPEC (applied by theme.apply_theme)
+LABEL_STYLES = {
+    'title': 'Title.TLabel',
+    'desc': 'Desc.TLabel',
+    'muted': 'Muted.TLabel',
+    'bold': 'Bold.TLabel',
+    'caption': 'Caption.TLabel',
+    'link': 'Link.TLabel',
+}
+
+
+def make_label(parent, text, preset, **kwargs):
+    """Create a ttk.Label styled by one of the LABEL_STYLES presets"""
+    return ttk.Label(parent, text=text, style=LABEL_STYLES[preset], **kwargs)
+
+
+def _open_homepage(event=None):
+    """Open the author's homepage in the default browser"""
+    import webbrowser
+    webbrowser.open_new(HOMEPAGE_URL)
+
 
 class AboutWindow(tk.Toplevel):
+    # The About content is static, so a single window is built once and
+    # then hidden/shown instead of being recreated on every open
+    _instance = None
+
+    # Rasterized images keyed by their render parameters; holding them on
+    # the class keeps each PhotoImage alive in Tcl's image table
+    _IMG_CACHE = {}
+
+    @classmethod
+    def _tech_sprite(cls, color, size, slot):
+        """Compose all tech icons into one image, each centered in a slot px wide"""
+        key = ('tech', color, size, slot)
+        img = cls._IMG_CACHE.get(key)
+        if img is None:
+            # Imported here so the icon package is only loaded once About is built
+            from PIL import Image, ImageTk
+            from ttkbootstrap_icons_fa.icon import FAIcon
+            sheet = Image.new('RGBA', (slot * len(TECH_ICONS), size), (0, 0, 0, 0))
+            for i, (icon_name, _, style) in enumerate(TECH_ICONS):
+                icon = ImageTk.getimage(FAIcon(icon_name, color=color, size=size, style=style).image)
+                sheet.paste(icon, (i * slot + (slot - icon.width) // 2, (size - icon.height) // 2), icon)
+            img = ImageTk.PhotoImage(sheet)
+            cls._IMG_CACHE[key] = img
+        return img
+
+    @classmethod
+    def show(cls, parent, on_close=None):
+        """Show the About window, building it on first use.
+
+        Returns immediately; on_close (if given) is called once the
+        window has been dismissed.
+        """
+        window = cls._instance
+        if window is None or not window.winfo_exists():
+            window = cls(parent)
+        window._on_close = on_close
+        window.deiconify()
+        window.lift()
+        window.grab_set()
+
+    @classmethod
+    def preload(cls, parent):
+        """Build the hidden About window ahead of the first open"""
+        if cls._instance is None or not cls._instance.winfo_exists():
+            cls(parent)
+
     def __init__(self, parent):
         super().__init__(parent)
+        # Build hidden at a fixed size so children don't trigger
+        # resize/relayout passes while they're being added
+        self.withdraw()
+        self.pack_propagate(False)
+        self.grid_propagate(False)
+        AboutWindow._instance = self
+        self._on_close = None
         self.title("About Neuro-Traffic")
         self.geometry("400x300")
         self.configure(bg=BG_SIDEBAR)
 
+        # A single weighted grid cell centers main_frame without place()
         outer_frame = ttk.Frame(self, style='TFrame')
         outer_frame.pack(fill='both', expand=True)
+        outer_frame.grid_rowconfigure(0, weight=1)
+        outer_frame.grid_columnconfigure(0, weight=1)
 
         main_frame = ttk.Frame(outer_frame, style='TFrame')
         
-        title_label = ttk.Label(main_frame, text="Neuro-Traffic", font=FONT_TITLE, foreground=ACCENT_PRIMARY, background=BG_SIDEBAR)
+        title_label = make_label(main_frame, "Neuro-Traffic", 'title')
         title_label.pack(pady=(0, PAD_SMALL))
         
         desc_text = "A real-time traffic simulation with an intelligent fuzzy logic controller."
-        desc_label = ttk.Label(main_frame, text=desc_text, wraplength=350, justify='center', background=BG_SIDEBAR)
+        desc_label = make_label(main_frame, desc_text, 'desc')
         desc_label.pack(pady=PAD_SMALL)
 
-        version_label = ttk.Label(main_frame, text="Version 1.0", font=FONT_SMALL, foreground=TEXT_MUTED, background=BG_SIDEBAR)
+        version_label = make_label(main_frame, "Version 1.0", 'muted')
         version_label.pack()
 
         tech_frame = ttk.Frame(main_frame, style='TFrame')
         tech_frame.pack(pady=PAD_LARGE)
 
-        tech_title = ttk.Label(tech_frame, text="Built with:", font=FONT_LABEL_BOLD, background=BG_SIDEBAR)
+        tech_title = make_label(tech_frame, "Built with:", 'bold')
         tech_title.pack(pady=(0, PAD_SMALL))
 
         icons_frame = ttk.Frame(tech_frame, style='TFrame')
         icons_frame.pack()
 
-        self.create_icon(icons_frame, "python", "Python", style='brands')
-        self.create_icon(icons_frame, "window-maximize", "Tkinter")
-        self.create_icon(icons_frame, "brain", "Fuzzy Logic")
+        self.create_tech_icons(icons_frame)
 
         # Made by section with clickable underlined f0lder link
         made_by_frame = ttk.Frame(main_frame, style='TFrame')
         made_by_frame.pack(pady=(PAD_LARGE, 0))
         
-        ttk.Label(made_by_frame, text="Made with <3 by ", font=FONT_SMALL, foreground=TEXT_MUTED, background=BG_SIDEBAR).pack(side='left')
+        make_label(made_by_frame, "Made with <3 by ", 'muted').pack(side='left')
         
-        folder_link = tk.Label(made_by_frame, text="f0lder", font=(FONT_FAMILY, 9, "underline"), fg=ACCENT_PRIMARY, bg=BG_SIDEBAR)
+        # Tk only shows the widget cursor while hovering, so no Enter/Leave swap is needed
+        folder_link = make_label(made_by_frame, "f0lder", 'link', cursor="hand2")
         folder_link.pack(side='left')
-        folder_link.bind("<Button-1>", lambda e: webbrowser.open_new("https://fldr.xyz"))
-        folder_link.bind("<Enter>", lambda e: folder_link.config(cursor="hand2"))
-        folder_link.bind("<Leave>", lambda e: folder_link.config(cursor=""))
+        folder_link.bind("<Button-1>", _open_homepage)
         
-        ok_button = ttk.Button(main_frame, text="OK", command=self.destroy)
+        ok_button = ttk.Button(main_frame, text="OK", command=self.close)
         ok_button.pack(pady=(PAD_LARGE, 0))
 
-        main_frame.place(relx=0.5, rely=0.5, anchor='center')
+        main_frame.grid(row=0, column=0)
 
         self.transient(parent)
-        self.grab_set()
-        parent.wait_window(self)
+        self.protocol("WM_DELETE_WINDOW", self.close)
+        # Settle geometry once now rather than on the first deiconify
+        self.update_idletasks()
 
-    def create_icon(self, parent, icon_name, text, style=None):
-        icon_frame = ttk.Frame(parent, style='TFrame')
-        
-        # Icon image
-        img = FAIcon(icon_name, color=ACCENT_PRIMARY, size=24, style=style).image
-        icon_label = ttk.Label(icon_frame, image=img, background=BG_SIDEBAR)
-        icon_label.image = img
-        icon_label.pack()
+    def close(self):
+        """Hide the window, keeping its widgets for the next open"""
+        self.grab_release()
+        self.withdraw()
+        on_close, self._on_close = self._on_close, None
+        if on_close is not None:
+            on_close()
+
+    def create_tech_icons(self, parent):
+        """Show the tech icons as a single sprite with captions gridded beneath"""
+        # The caption style uses a named font: wrap it rather than creating a copy
+        caption_font = tkfont.nametofont(ttk.Style(self).lookup(LABEL_STYLES['caption'], 'font'))
+        icon_size = 24
+        slot = max([icon_size] + [caption_font.measure(text) for _, text, _ in TECH_ICONS]) + 2 * PAD_SMALL
         
-        # Text label
-        label = ttk.Label(icon_frame, text=text, font=FONT_TINY, background=BG_SIDEBAR)
-        label.pack()
+        sprite = AboutWindow._tech_sprite(ACCENT_PRIMARY, icon_size, slot)
+        ttk.Label(parent, image=sprite).grid(row=0, column=0, columnspan=len(TECH_ICONS))
         
-        icon_frame.pack(side='left', padx=PAD_SMALL)
\ No newline at end of file
+        for column, (_, text, _) in enumerate(TECH_ICONS):
+            parent.columnconfigure(column, minsize=slot)
+            make_label(parent, text, 'caption').grid(row=1, column=column)
@@ -8,6 +8,7 @@ import tkinter as tk
 from tkinter import ttk
 import random
 import time
+from bisect import bisect_left
 from collections import deque
 
 # Local imports
@@ -41,7 +42,7 @@ from theme import (
     PAD_TINY, PAD_SMALL, PAD_MEDIUM, PAD_LARGE, PAD_XLARGE,
     PAD_SECTION_TOP, PAD_SECTION_START, PAD_ROW, PAD_ELEMENT, PAD_FRAME, PAD_BUTTON,
     # Helpers
-    get_efficiency_color, get_flow_status, get_capacity_color, get_gauge_bar_color,
+    get_efficiency_color,
     # Font family for dynamic fonts
     FONT_FAMILY
 )
@@ -49,10 +50,87 @@ from fuzzy_logic import FuzzyLogicController, FuzzyVisualizer
 from about import AboutWindow
 from settings import SettingsWindow
 
+# Approach directions, in phase order
+LANES = ('N', 'S', 'E', 'W')
+
+# HCM Level of Service: max average delay (sec) for grades A-E; anything above is F
+LOS_THRESHOLDS = (10, 20, 35, 55, 80)
+LOS_GRADES = (
+    ('A', 'Free Flow', STATUS_GOOD),
+    ('B', 'Stable', STATUS_GOOD),
+    ('C', 'Acceptable', STATUS_WARNING),
+    ('D', 'Unstable', STATUS_WARNING),
+    ('E', 'Poor', STATUS_ERROR),
+    ('F', 'Failure', STATUS_ERROR),
+)
+
+
+class LaneWaitStats:
+    """
+    Wait times of cars that have cleared one lane
+    
+    The mean over the last `size` cars comes from a ring buffer with a
+    running sum; the max over a sliding time window from a monotonic deque
+    whose old entries are dropped by prune(). Both are O(1) (amortized).
+    """
+    
+    __slots__ = ('ring', 'idx', 'count', 'total', 'peaks')
+    
+    def __init__(self, size=50):
+        self.ring = [0.0] * size
+        self.idx = 0
+        self.count = 0
+        self.total = 0.0
+        # (timestamp, wait_seconds) with waits strictly decreasing front to back
+        self.peaks = deque()
+    
+    def record(self, now, wait):
+        """Add the wait (seconds) of a car that cleared at `now`"""
+        ring = self.ring
+        self.total += wait - ring[self.idx]
+        ring[self.idx] = wait
+        self.idx = (self.idx + 1) % len(ring)
+        if self.count < len(ring):
+            self.count += 1
+        
+        # Older entries that wait no longer can never be the max again
+        peaks = self.peaks
+        while peaks and peaks[-1][1] <= wait:
+            peaks.pop()
+        peaks.append((now, wait))
+    
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0
+    
+    @property
+    def max(self):
+        """Longest wait recorded since the last prune cutoff"""
+        return self.peaks[0][1] if self.peaks else 0
+    
+    def prune(self, cutoff):
+        """Forget waits recorded before `cutoff`; returns True if any were dropped"""
+        peaks = self.peaks
+        if not peaks or peaks[0][0] >= cutoff:
+            return False
+        while peaks and peaks[0][0] < cutoff:
+            peaks.popleft()
+        return True
+
 
 class UltimateTrafficApp(tk.Tk):
     """Main Traffic Simulation Application"""
     
+    # Scale marks along the bottom of the flow gauge
+    _GAUGE_TICKS = (0, 25, 50, 75, 100)
+    
+    # Unit offsets from the canvas centre for each lane's queue label and light
+    _QUEUE_SIDE = {'N': (0, -1), 'S': (0, 1), 'W': (-1, 0), 'E': (1, 0)}
+    _LIGHT_CORNER = {'N': (-1, -1), 'S': (1, 1), 'W': (-1, 1), 'E': (1, -1)}
+    
+    # Red lanes for each phase index of phase_order
+    _OTHERS = (('S', 'E', 'W'), ('N', 'E', 'W'), ('N', 'S', 'W'), ('N', 'S', 'E'))
+    
     def __init__(self):
         super().__init__()
         self.title("Neuro-Traffic: Fuzzy Logic Signal Controller")
@@ -63,14 +141,19 @@ class UltimateTrafficApp(tk.Tk):
         
         # Initialize fuzzy logic controller
         self.fuzzy_controller = FuzzyLogicController()
-        self.fuzzy_viz = FuzzyVisualizer()
+        # A resized fuzzy canvas must be redrawn even when no input changed
+        self.fuzzy_viz = FuzzyVisualizer(on_resize=lambda: setattr(self, '_overlays_dirty', True))
 
         # --- STATE ---
-        self.cars = []
+        # Cars per lane, front (furthest along) to back. Cars never overtake,
+        # so spawn order is also spatial order and no per-frame sort is needed
+        self.lane_cars = {'N': deque(), 'S': deque(), 'E': deque(), 'W': deque()}
+        self.max_wait_ticks = 0  # Longest wait of any car, updated by update_physics
+        self.cars_in_intersection = 0  # Cars within 100px of the center, ditto
         self.virtual_queues = {'N': 0, 'S': 0, 'E': 0, 'W': 0}
         
         self.lights = {'N': 'red', 'S': 'red', 'E': 'red', 'W': 'red'}
-        self.phase_order = ['N', 'S', 'E', 'W']
+        self.phase_order = LANES
         self.current_phase_idx = 0
         self.fsm_state = 'GREEN'
         self.state_timer = 0
@@ -82,31 +165,49 @@ class UltimateTrafficApp(tk.Tk):
         self.exit_timestamps = deque()
         self.current_flow = 0.0
         self.target_flow = 40.0
+        self._target_cpm = 40.0  # Mirror of rate_var, read by the simulation loop
         self.theoretical_capacity = 24.0  # Will be updated dynamically
+        self.realworld_expected_low = self.target_flow * 0.7   # Updated by update_realworld_comparison
+        self.realworld_expected_high = self.target_flow * 0.9
+        self.start_time = None  # Set when the first car spawns
         self.spawn_credit = 0.0
-        self.last_frame_time = time.time()
+        self.last_frame_time = time.monotonic()
+        self._prune_counter = 0
         
-        # Lane wait time tracking
-        self.lane_wait_times = {'N': deque(maxlen=50), 'S': deque(maxlen=50), 
-                                'E': deque(maxlen=50), 'W': deque(maxlen=50)}
+        # Lane wait time tracking: mean of the last 50 cars, max over the last 60 sec
+        self.lane_wait_stats = {lane: LaneWaitStats(50) for lane in LANES}
         self.lane_mean_wait = {'N': 0, 'S': 0, 'E': 0, 'W': 0}
         
-        # Wait time history with timestamps for max wait in last 60 sec
-        # Each entry is (timestamp, wait_seconds)
-        self.lane_wait_history = {'N': deque(), 'S': deque(), 
-                                  'E': deque(), 'W': deque()}
-        
         # Throughput history (last 60 samples, ~1 per second)
         self.throughput_history = deque(maxlen=60)
-        self.history_update_time = time.time()
+        self._history_xs = []
+        self._history_idx = None
+        self._history_xs_key = None
+        self.history_update_time = time.monotonic()
         
         # Cached canvas dimensions
         self.canvas_width = 700
         self.canvas_height = 800
         self.sidebar_width = 650
         
+        # Reusable car rectangles on the main canvas; only the first
+        # _car_items_shown are visible, the rest are hidden spares
+        self._car_items = []
+        self._car_item_fills = []  # Fill last applied to each pooled item
+        self._car_items_shown = 0
+        
+        # Dashboard/fuzzy panels are redrawn on their own slower timer;
+        # the simulation only records what to show and marks them dirty
+        self._fuzzy_view = None
+        self._fuzzy_key = None
+        # Last options applied per label by _set_label
+        self._label_state = {}
+        self._overlays_dirty = True
+        self._sidebar_tab = 0  # Index of the visible sidebar tab (0 = Dashboard)
+        
         self.setup_ui()
         self.run_simulation()
+        self._draw_slow_overlays()
 
     # =========================================================================
     # UI SETUP
@@ -116,51 +217,8 @@ class UltimateTrafficApp(tk.Tk):
         """Configure ttk styles to match the app's theme."""
         self.style = ttk.Style()
         self.style.theme_use('default')
-
-        # --- Frames ---
-        self.style.configure('TFrame', background=BG_SIDEBAR)
-        self.style.configure('Dark.TFrame', background=BG_DARK)
-        self.style.configure('Viz.TFrame', background='black', relief='sunken', borderwidth=2)
-
-        # --- PanedWindow ---
-        self.style.configure('TPanedwindow', background=BG_MAIN)
-        self.style.map('TPanedwindow.Sash', background=[('!active', BG_MAIN)], troughcolor=[('!active', BG_MAIN)])
-
-        # --- Labels --- (use theme.FONT_* for dynamic updates)
-        self.style.configure('TLabel', background=BG_SIDEBAR, foreground=TEXT_PRIMARY, font=theme.FONT_NORMAL)
-        self.style.configure('Dark.TLabel', background=BG_DARK, foreground=TEXT_PRIMARY, font=theme.FONT_LABEL_BOLD)
-        self.style.configure('Header.TLabel', background=BG_DARK, foreground=TEXT_MUTED, font=theme.FONT_LABEL_BOLD)
-        self.style.configure('Primary.TLabel', background=BG_SIDEBAR, foreground=ACCENT_PRIMARY, font=theme.FONT_LABEL)
-        self.style.configure('Demand.TLabel', background=BG_SIDEBAR, foreground=GAUGE_DEMAND_LINE, font=theme.FONT_LABEL)
-        self.style.configure('RealWorld.TLabel', background=BG_SIDEBAR, foreground=ACCENT_TERTIARY, font=theme.FONT_LABEL)
-        self.style.configure('Value.Primary.TLabel', background=BG_SIDEBAR, foreground=ACCENT_PRIMARY, font=theme.FONT_VALUE_MEDIUM)
-        self.style.configure('Value.Demand.TLabel', background=BG_SIDEBAR, foreground=GAUGE_DEMAND_LINE, font=theme.FONT_VALUE_MEDIUM)
-        self.style.configure('Value.RealWorld.TLabel', background=BG_SIDEBAR, foreground=ACCENT_TERTIARY, font=theme.FONT_VALUE_MEDIUM)
-        self.style.configure('Status.TLabel', background=BG_SIDEBAR, foreground=TEXT_MUTED, font=theme.FONT_STATUS)
-        self.style.configure('Overall.Status.TLabel', background=BG_DARK, foreground=TEXT_MUTED, font=theme.FONT_STATUS)
-        self.style.configure('Small.TLabel', background=BG_SIDEBAR, foreground=TEXT_PRIMARY, font=theme.FONT_VALUE_SMALL)
-        self.style.configure('Small.Muted.TLabel', background=BG_SIDEBAR, foreground=TEXT_MUTED, font=theme.FONT_VALUE_SMALL)
-        self.style.configure('LOS.TLabel', background=BG_SIDEBAR, font=theme.FONT_VALUE_MEDIUM)
-        self.style.configure('Overall.LOS.TLabel', background=BG_DARK, font=theme.FONT_VALUE_LARGE)
-        self.style.configure('Section.TLabel', background=BG_SIDEBAR, foreground=TEXT_SECONDARY, font=theme.FONT_LABEL)
-        
-        # --- Button ---
-        self.style.configure('TButton', font=theme.FONT_LABEL_BOLD, foreground=TEXT_PRIMARY)
-        self.style.map('TButton',
-            background=[('!active', ACCENT_SECONDARY), ('active', ACCENT_PRIMARY)],
-        )
-
-        # --- Scale ---
-        self.style.configure('Horizontal.TScale', background=BG_SIDEBAR)
-        
-        # --- Notebook (Tabs) ---
-        self.style.configure('TNotebook', background=BG_MAIN, borderwidth=0)
-        self.style.configure('TNotebook.Tab', background=BG_DARK, foreground=TEXT_MUTED, 
-                            font=theme.FONT_LABEL_BOLD, padding=[12, 6])
-        self.style.map('TNotebook.Tab',
-            background=[('selected', BG_SIDEBAR), ('!selected', BG_DARK)],
-            foreground=[('selected', ACCENT_PRIMARY), ('!selected', TEXT_MUTED)],
-        )
+        theme.register_named_fonts(self)
+        theme.apply_theme_if_changed(self.style)
 
     def setup_ui(self):
         """Setup the main UI layout"""
@@ -186,6 +244,8 @@ class UltimateTrafficApp(tk.Tk):
         viz_frame = ttk.Frame(self.main_pane, style='Viz.TFrame')
         self.canvas = tk.Canvas(viz_frame, bg=BG_CANVAS, highlightthickness=0)
         self.canvas.pack(fill='both', expand=True)
+        self.canvas.bind('<Configure>', self._on_canvas_configure)
+        self._create_canvas_items(self.canvas)
         self.main_pane.add(viz_frame, weight=1)
 
         # Right: Dashboard sidebar
@@ -196,8 +256,11 @@ class UltimateTrafficApp(tk.Tk):
         
         self.sidebar.bind('<Configure>', self._on_sidebar_resize)
 
+        # Build the About window while idle so the first open is instant
+        self.after_idle(AboutWindow.preload, self)
+
     def open_about(self):
-        AboutWindow(self)
+        AboutWindow.show(self)
 
     def open_settings(self):
         SettingsWindow(self)
@@ -218,6 +281,9 @@ class UltimateTrafficApp(tk.Tk):
         self._setup_lane_stats(self.dashboard_frame)
         self._setup_controls(self.dashboard_frame)
         self._setup_fuzzy_engine(self.fuzzy_frame)
+        self._overlays_dirty = True
+        self._label_state.clear()
+        self.canvas.itemconfig('queue', font=theme.get_font(theme.FONT_VALUE_SMALL))
         
         # Update scroll regions
         self.dashboard_frame.update_idletasks()
@@ -275,6 +341,9 @@ class UltimateTrafficApp(tk.Tk):
         self._setup_controls(self.dashboard_frame)
         self._setup_fuzzy_engine(self.fuzzy_frame)
         
+        # Only the visible tab's panels are redrawn
+        self.sidebar_notebook.bind('<<NotebookTabChanged>>', self._on_sidebar_tab_changed)
+        
         # Bind mousewheel to both canvases
         self.dashboard_canvas.bind('<Enter>', lambda e: self._bind_mousewheel_to(self.dashboard_canvas))
         self.dashboard_canvas.bind('<Leave>', lambda e: self._unbind_mousewheel())
@@ -287,7 +356,7 @@ class UltimateTrafficApp(tk.Tk):
         flow_label = tk.Frame(parent, bg=BG_SIDEBAR)
         self.flow_icon_img = FAIcon("chart-line", color=ACCENT_PRIMARY, size=18).image
         tk.Label(flow_label, image=self.flow_icon_img, bg=BG_SIDEBAR).pack(side='left', padx=(0, 6), pady=2)
-        tk.Label(flow_label, text="FLOW ANALYZER", font=theme.FONT_LABEL_BOLD, fg=ACCENT_PRIMARY, bg=BG_SIDEBAR).pack(side='left', pady=2)
+        tk.Label(flow_label, text="FLOW ANALYZER", font=theme.get_font(theme.FONT_LABEL_BOLD), fg=ACCENT_PRIMARY, bg=BG_SIDEBAR).pack(side='left', pady=2)
         
         bench_frame = tk.LabelFrame(
             parent, labelwidget=flow_label,
@@ -301,27 +370,27 @@ class UltimateTrafficApp(tk.Tk):
         header = tk.Frame(content, bg=BG_DARK)
         header.pack(fill='x', pady=(0, PAD_TINY))
         
-        tk.Label(header, text="Metric", font=theme.FONT_LABEL_BOLD, fg=TEXT_MUTED, bg=BG_DARK, width=14, anchor='w').pack(side='left', padx=PAD_SMALL)
-        tk.Label(header, text="Value", font=theme.FONT_LABEL_BOLD, fg=TEXT_MUTED, bg=BG_DARK, width=8).pack(side='left')
-        tk.Label(header, text="Status", font=theme.FONT_LABEL_BOLD, fg=TEXT_MUTED, bg=BG_DARK).pack(side='right', padx=PAD_SMALL)
+        tk.Label(header, text="Metric", font=theme.get_font(theme.FONT_LABEL_BOLD), fg=TEXT_MUTED, bg=BG_DARK, width=14, anchor='w').pack(side='left', padx=PAD_SMALL)
+        tk.Label(header, text="Value", font=theme.get_font(theme.FONT_LABEL_BOLD), fg=TEXT_MUTED, bg=BG_DARK, width=8).pack(side='left')
+        tk.Label(header, text="Status", font=theme.get_font(theme.FONT_LABEL_BOLD), fg=TEXT_MUTED, bg=BG_DARK).pack(side='right', padx=PAD_SMALL)
         
         row1 = tk.Frame(content, bg=BG_SIDEBAR)
         row1.pack(fill='x', pady=PAD_ROW)
         
         tk.Label(
             row1, text="⬤ Simulation:",
-            fg=ACCENT_PRIMARY, bg=BG_SIDEBAR, font=theme.FONT_LABEL, width=14, anchor='w'
+            fg=ACCENT_PRIMARY, bg=BG_SIDEBAR, font=theme.get_font(theme.FONT_LABEL), width=14, anchor='w'
         ).pack(side='left')
         
         self.lbl_my_flow = tk.Label(
             row1, text="0.0",
-            fg=ACCENT_PRIMARY, bg=BG_SIDEBAR, font=theme.FONT_VALUE_MEDIUM, width=8, anchor='e'
+            fg=ACCENT_PRIMARY, bg=BG_SIDEBAR, font=theme.get_font(theme.FONT_VALUE_MEDIUM), width=8, anchor='e'
         )
         self.lbl_my_flow.pack(side='left')
         
         self.lbl_flow_status = tk.Label(
             row1, text="",
-            fg=TEXT_MUTED, bg=BG_SIDEBAR, font=theme.FONT_STATUS
+            fg=TEXT_MUTED, bg=BG_SIDEBAR, font=theme.get_font(theme.FONT_STATUS)
         )
         self.lbl_flow_status.pack(side='right')
         
@@ -330,18 +399,18 @@ class UltimateTrafficApp(tk.Tk):
         
         tk.Label(
             row2, text="⬤ Demand:",
-            fg=GAUGE_DEMAND_LINE, bg=BG_SIDEBAR, font=theme.FONT_LABEL, width=14, anchor='w'
+            fg=GAUGE_DEMAND_LINE, bg=BG_SIDEBAR, font=theme.get_font(theme.FONT_LABEL), width=14, anchor='w'
         ).pack(side='left')
         
         self.lbl_target_flow = tk.Label(
             row2, text="40",
-            fg=GAUGE_DEMAND_LINE, bg=BG_SIDEBAR, font=theme.FONT_VALUE_MEDIUM, width=8, anchor='e'
+            fg=GAUGE_DEMAND_LINE, bg=BG_SIDEBAR, font=theme.get_font(theme.FONT_VALUE_MEDIUM), width=8, anchor='e'
         )
         self.lbl_target_flow.pack(side='left')
         
         self.lbl_efficiency = tk.Label(
             row2, text="--%",
-            fg=TEXT_MUTED, bg=BG_SIDEBAR, font=theme.FONT_STATUS
+            fg=TEXT_MUTED, bg=BG_SIDEBAR, font=theme.get_font(theme.FONT_STATUS)
         )
         self.lbl_efficiency.pack(side='right')
         
@@ -350,18 +419,18 @@ class UltimateTrafficApp(tk.Tk):
         
         tk.Label(
             row3, text="⬤ Real-World:",
-            fg=ACCENT_TERTIARY, bg=BG_SIDEBAR, font=theme.FONT_LABEL, width=14, anchor='w'
+            fg=ACCENT_TERTIARY, bg=BG_SIDEBAR, font=theme.get_font(theme.FONT_LABEL), width=14, anchor='w'
         ).pack(side='left')
         
         self.lbl_realworld = tk.Label(
             row3, text="28-36",
-            fg=ACCENT_TERTIARY, bg=BG_SIDEBAR, font=theme.FONT_VALUE_MEDIUM, width=8, anchor='e'
+            fg=ACCENT_TERTIARY, bg=BG_SIDEBAR, font=theme.get_font(theme.FONT_VALUE_MEDIUM), width=8, anchor='e'
         )
         self.lbl_realworld.pack(side='left')
         
         self.lbl_comparison = tk.Label(
             row3, text="HCM typical",
-            fg=TEXT_MUTED, bg=BG_SIDEBAR, font=theme.FONT_STATUS
+            fg=TEXT_MUTED, bg=BG_SIDEBAR, font=theme.get_font(theme.FONT_STATUS)
         )
         self.lbl_comparison.pack(side='right')
         
@@ -372,10 +441,12 @@ class UltimateTrafficApp(tk.Tk):
             bg=BG_DARK, highlightthickness=1, highlightbackground=BORDER_DARK
         )
         self.gauge_canvas.pack(fill='x', expand=True)
+        self._gauge_items = self._create_gauge_items(self.gauge_canvas)
+        self._gauge_key = None
         
         tk.Label(
             content, text="History (60s)",
-            font=theme.FONT_LABEL, fg=TEXT_SECONDARY, bg=BG_SIDEBAR
+            font=theme.get_font(theme.FONT_LABEL), fg=TEXT_SECONDARY, bg=BG_SIDEBAR
         ).pack(anchor='w', pady=(PAD_SMALL, 0))
         
         self.cv_history = tk.Canvas(
@@ -383,6 +454,7 @@ class UltimateTrafficApp(tk.Tk):
             highlightthickness=1, highlightbackground=BORDER_DARK
         )
         self.cv_history.pack(fill='x', pady=(PAD_TINY, PAD_SMALL))
+        self._history_items = self._create_history_items(self.cv_history)
 
     def _setup_lane_stats(self, parent):
         """Setup Lane Statistics section with mean wait time and LOS"""
@@ -390,7 +462,7 @@ class UltimateTrafficApp(tk.Tk):
         lane_label = tk.Frame(parent, bg=BG_SIDEBAR)
         self.lane_icon_img = FAIcon("road", color=ACCENT_SECONDARY, size=18).image
         tk.Label(lane_label, image=self.lane_icon_img, bg=BG_SIDEBAR).pack(side='left', padx=(0, 6), pady=2)
-        tk.Label(lane_label, text="LANE STATISTICS", font=theme.FONT_LABEL_BOLD, fg=ACCENT_SECONDARY, bg=BG_SIDEBAR).pack(side='left', pady=2)
+        tk.Label(lane_label, text="LANE STATISTICS", font=theme.get_font(theme.FONT_LABEL_BOLD), fg=ACCENT_SECONDARY, bg=BG_SIDEBAR).pack(side='left', pady=2)
         
         stats_frame = tk.LabelFrame(
             parent, labelwidget=lane_label,
@@ -401,29 +473,29 @@ class UltimateTrafficApp(tk.Tk):
         header = tk.Frame(stats_frame, bg=BG_SIDEBAR)
         header.pack(fill='x', padx=PAD_FRAME, pady=(PAD_SMALL, 0))
         
-        tk.Label(header, text="Lane", font=theme.FONT_LABEL_BOLD, fg=TEXT_SECONDARY, bg=BG_SIDEBAR, width=5).pack(side='left')
-        tk.Label(header, text="Avg", font=theme.FONT_LABEL_BOLD, fg=TEXT_SECONDARY, bg=BG_SIDEBAR, width=7).pack(side='left')
-        tk.Label(header, text="Max(60s)", font=theme.FONT_LABEL_BOLD, fg=TEXT_SECONDARY, bg=BG_SIDEBAR, width=8).pack(side='left')
-        tk.Label(header, text="LOS", font=theme.FONT_LABEL_BOLD, fg=TEXT_SECONDARY, bg=BG_SIDEBAR, width=4).pack(side='left')
-        tk.Label(header, text="Grade", font=theme.FONT_LABEL_BOLD, fg=TEXT_SECONDARY, bg=BG_SIDEBAR).pack(side='right')
+        tk.Label(header, text="Lane", font=theme.get_font(theme.FONT_LABEL_BOLD), fg=TEXT_SECONDARY, bg=BG_SIDEBAR, width=5).pack(side='left')
+        tk.Label(header, text="Avg", font=theme.get_font(theme.FONT_LABEL_BOLD), fg=TEXT_SECONDARY, bg=BG_SIDEBAR, width=7).pack(side='left')
+        tk.Label(header, text="Max(60s)", font=theme.get_font(theme.FONT_LABEL_BOLD), fg=TEXT_SECONDARY, bg=BG_SIDEBAR, width=8).pack(side='left')
+        tk.Label(header, text="LOS", font=theme.get_font(theme.FONT_LABEL_BOLD), fg=TEXT_SECONDARY, bg=BG_SIDEBAR, width=4).pack(side='left')
+        tk.Label(header, text="Grade", font=theme.get_font(theme.FONT_LABEL_BOLD), fg=TEXT_SECONDARY, bg=BG_SIDEBAR).pack(side='right')
         
         self.lane_labels = {}
-        for lane in ['N', 'S', 'E', 'W']:
+        for lane in LANES:
             row = tk.Frame(stats_frame, bg=BG_SIDEBAR)
             row.pack(fill='x', padx=PAD_FRAME, pady=PAD_ROW)
             
-            tk.Label(row, text=lane, font=theme.FONT_LABEL, fg=TEXT_PRIMARY, bg=BG_SIDEBAR, width=5).pack(side='left')
+            tk.Label(row, text=lane, font=theme.get_font(theme.FONT_LABEL), fg=TEXT_PRIMARY, bg=BG_SIDEBAR, width=5).pack(side='left')
             
-            wait_lbl = tk.Label(row, text="0.0s", font=theme.FONT_VALUE_SMALL, fg=TEXT_PRIMARY, bg=BG_SIDEBAR, width=7)
+            wait_lbl = tk.Label(row, text="0.0s", font=theme.get_font(theme.FONT_VALUE_SMALL), fg=TEXT_PRIMARY, bg=BG_SIDEBAR, width=7)
             wait_lbl.pack(side='left')
             
-            max_wait_lbl = tk.Label(row, text="0.0s", font=theme.FONT_VALUE_SMALL, fg=TEXT_MUTED, bg=BG_SIDEBAR, width=8)
+            max_wait_lbl = tk.Label(row, text="0.0s", font=theme.get_font(theme.FONT_VALUE_SMALL), fg=TEXT_MUTED, bg=BG_SIDEBAR, width=8)
             max_wait_lbl.pack(side='left')
             
-            los_lbl = tk.Label(row, text="A", font=theme.FONT_VALUE_MEDIUM, fg=STATUS_GOOD, bg=BG_SIDEBAR, width=4)
+            los_lbl = tk.Label(row, text="A", font=theme.get_font(theme.FONT_VALUE_MEDIUM), fg=STATUS_GOOD, bg=BG_SIDEBAR, width=4)
             los_lbl.pack(side='left')
             
-            grade_lbl = tk.Label(row, text="Free Flow", font=theme.FONT_STATUS, fg=STATUS_GOOD, bg=BG_SIDEBAR)
+            grade_lbl = tk.Label(row, text="Free Flow", font=theme.get_font(theme.FONT_STATUS), fg=STATUS_GOOD, bg=BG_SIDEBAR)
             grade_lbl.pack(side='right')
             
             self.lane_labels[lane] = {'wait': wait_lbl, 'max_wait': max_wait_lbl, 'los': los_lbl, 'grade': grade_lbl}
@@ -431,10 +503,10 @@ class UltimateTrafficApp(tk.Tk):
         overall_row = tk.Frame(stats_frame, bg=BG_DARK)
         overall_row.pack(fill='x', padx=PAD_FRAME, pady=(PAD_SMALL, PAD_SMALL))
         
-        tk.Label(overall_row, text="Overall:", font=theme.FONT_LABEL_BOLD, fg=TEXT_PRIMARY, bg=BG_DARK).pack(side='left', padx=PAD_SMALL)
-        self.lbl_overall_los = tk.Label(overall_row, text="A", font=theme.FONT_VALUE_LARGE, fg=STATUS_GOOD, bg=BG_DARK)
+        tk.Label(overall_row, text="Overall:", font=theme.get_font(theme.FONT_LABEL_BOLD), fg=TEXT_PRIMARY, bg=BG_DARK).pack(side='left', padx=PAD_SMALL)
+        self.lbl_overall_los = tk.Label(overall_row, text="A", font=theme.get_font(theme.FONT_VALUE_LARGE), fg=STATUS_GOOD, bg=BG_DARK)
         self.lbl_overall_los.pack(side='left', padx=PAD_MEDIUM)
-        self.lbl_overall_desc = tk.Label(overall_row, text="Free Flow", font=theme.FONT_STATUS, fg=STATUS_GOOD, bg=BG_DARK)
+        self.lbl_overall_desc = tk.Label(overall_row, text="Free Flow", font=theme.get_font(theme.FONT_STATUS), fg=STATUS_GOOD, bg=BG_DARK)
         self.lbl_overall_desc.pack(side='right', padx=PAD_SMALL)
 
     def _setup_fuzzy_engine(self, parent):
@@ -446,7 +518,7 @@ class UltimateTrafficApp(tk.Tk):
         fuzzy_label = tk.Frame(fuzzy_frame, bg=BG_SIDEBAR)
         self.fuzzy_icon_img = FAIcon("brain", color=ACCENT_SECONDARY, size=18).image
         tk.Label(fuzzy_label, image=self.fuzzy_icon_img, bg=BG_SIDEBAR).pack(side='left', padx=(0, 6), pady=2)
-        tk.Label(fuzzy_label, text="FUZZY ENGINE - Membership Functions", font=theme.FONT_LABEL_BOLD, fg=ACCENT_SECONDARY, bg=BG_SIDEBAR).pack(side='left', pady=2)
+        tk.Label(fuzzy_label, text="FUZZY ENGINE - Membership Functions", font=theme.get_font(theme.FONT_LABEL_BOLD), fg=ACCENT_SECONDARY, bg=BG_SIDEBAR).pack(side='left', pady=2)
         
         mf_container = tk.LabelFrame(
             fuzzy_frame, labelwidget=fuzzy_label,
@@ -478,7 +550,7 @@ class UltimateTrafficApp(tk.Tk):
         rules_label = tk.Frame(fuzzy_frame, bg=BG_SIDEBAR)
         self.rules_icon_img = FAIcon("gear", color=TEXT_SECONDARY, size=18).image
         tk.Label(rules_label, image=self.rules_icon_img, bg=BG_SIDEBAR).pack(side='left', padx=(0, 6), pady=2)
-        tk.Label(rules_label, text="Rule Weights", font=theme.FONT_LABEL_BOLD, fg=TEXT_SECONDARY, bg=BG_SIDEBAR).pack(side='left', pady=2)
+        tk.Label(rules_label, text="Rule Weights", font=theme.get_font(theme.FONT_LABEL_BOLD), fg=TEXT_SECONDARY, bg=BG_SIDEBAR).pack(side='left', pady=2)
         
         rules_container = tk.LabelFrame(
             fuzzy_frame, labelwidget=rules_label,
@@ -517,7 +589,7 @@ class UltimateTrafficApp(tk.Tk):
             row.pack(fill='x', pady=1)
             
             # Rule name label
-            name_lbl = tk.Label(row, text=rule_name, font=theme.FONT_SMALL, fg=TEXT_PRIMARY, 
+            name_lbl = tk.Label(row, text=rule_name, font=theme.get_font(theme.FONT_SMALL), fg=TEXT_PRIMARY, 
                                bg=BG_DARK, width=10, anchor='e')
             name_lbl.pack(side='left', padx=(PAD_SMALL, PAD_TINY))
             
@@ -526,26 +598,29 @@ class UltimateTrafficApp(tk.Tk):
             bar_canvas.pack(side='left', fill='x', expand=True, padx=PAD_TINY)
             
             # Value label
-            value_lbl = tk.Label(row, text="0.00", font=theme.FONT_TINY, fg=TEXT_MUTED, 
+            value_lbl = tk.Label(row, text="0.00", font=theme.get_font(theme.FONT_TINY), fg=TEXT_MUTED, 
                                 bg=BG_DARK, width=5, anchor='w')
             value_lbl.pack(side='left', padx=PAD_TINY)
             
             # Weight label
-            weight_lbl = tk.Label(row, text=weight, font=theme.FONT_TINY, fg=TEXT_DISABLED, 
+            weight_lbl = tk.Label(row, text=weight, font=theme.get_font(theme.FONT_TINY), fg=TEXT_DISABLED, 
                                  bg=BG_DARK, width=5, anchor='w')
             weight_lbl.pack(side='left', padx=(0, PAD_SMALL))
             
             self.rule_rows[rule_id] = {
                 'canvas': bar_canvas,
                 'value_lbl': value_lbl,
-                'color': color
+                'color': color,
+                # Created once; update_rule_bars only moves them
+                'track': bar_canvas.create_rectangle(0, 0, 0, 0, fill=BG_DARK, outline=""),
+                'fill': bar_canvas.create_rectangle(0, 0, 0, 0, fill=color, outline=""),
             }
         
         # Create label widget with icon and text for output
         output_label = tk.Frame(fuzzy_frame, bg=BG_SIDEBAR)
         self.output_icon_img = FAIcon("circle-check", color=TEXT_SECONDARY, size=18).image
         tk.Label(output_label, image=self.output_icon_img, bg=BG_SIDEBAR).pack(side='left', padx=(0, 6), pady=2)
-        tk.Label(output_label, text="Decision Output", font=theme.FONT_LABEL_BOLD, fg=TEXT_SECONDARY, bg=BG_SIDEBAR).pack(side='left', pady=2)
+        tk.Label(output_label, text="Decision Output", font=theme.get_font(theme.FONT_LABEL_BOLD), fg=TEXT_SECONDARY, bg=BG_SIDEBAR).pack(side='left', pady=2)
         
         output_container = tk.LabelFrame(
             fuzzy_frame, labelwidget=output_label,
@@ -567,7 +642,7 @@ class UltimateTrafficApp(tk.Tk):
         control_label = tk.Frame(parent, bg=BG_SIDEBAR)
         self.control_icon_img = FAIcon("sliders", color=ACCENT_PRIMARY, size=18).image
         tk.Label(control_label, image=self.control_icon_img, bg=BG_SIDEBAR).pack(side='left', padx=(0, 6), pady=2)
-        tk.Label(control_label, text="CONTROLS", font=theme.FONT_LABEL_BOLD, fg=ACCENT_PRIMARY, bg=BG_SIDEBAR).pack(side='left', pady=2)
+        tk.Label(control_label, text="CONTROLS", font=theme.get_font(theme.FONT_LABEL_BOLD), fg=ACCENT_PRIMARY, bg=BG_SIDEBAR).pack(side='left', pady=2)
         
         control_frame = tk.LabelFrame(
             parent, labelwidget=control_label,
@@ -583,23 +658,24 @@ class UltimateTrafficApp(tk.Tk):
         
         tk.Label(
             demand_row, text="Demand (cars/min):",
-            fg=TEXT_SECONDARY, bg=BG_SIDEBAR, font=theme.FONT_LABEL
+            fg=TEXT_SECONDARY, bg=BG_SIDEBAR, font=theme.get_font(theme.FONT_LABEL)
         ).pack(side='left')
         
         self.rate_var = tk.DoubleVar(value=40)
         self.lbl_rate_val = tk.Label(
             demand_row, text="40",
-            fg=ACCENT_PRIMARY, bg=BG_SIDEBAR, font=theme.FONT_VALUE_MEDIUM
+            fg=ACCENT_PRIMARY, bg=BG_SIDEBAR, font=theme.get_font(theme.FONT_VALUE_MEDIUM)
         )
         self.lbl_rate_val.pack(side='right')
         
         def update_rate(*args):
             val = self.rate_var.get()
+            self._target_cpm = val
             self.lbl_rate_val.config(text=f"{val:.0f}")
             self.target_flow = val
             self.lbl_target_flow.config(text=f"{val:.0f}")
             self.update_capacity_estimate()
-            self.draw_gauge()
+            self._overlays_dirty = True
         
         # Use trace to ensure updates happen when variable changes
         self.rate_var.trace_add('write', update_rate)
@@ -630,6 +706,13 @@ class UltimateTrafficApp(tk.Tk):
         if hasattr(self, '_active_canvas'):
             self._active_canvas.yview_scroll(int(-1 * (event.delta / 120)), 'units')
     
+    def _on_sidebar_tab_changed(self, event):
+        """Remember the visible sidebar tab and bring it up to date"""
+        self._sidebar_tab = self.sidebar_notebook.index('current')
+        self._overlays_dirty = True
+        if self._sidebar_tab == 0:
+            self.draw_history_graph()
+    
     def _on_sidebar_resize(self, event):
         new_width = event.width - 20
         if new_width > 100:
@@ -640,19 +723,16 @@ class UltimateTrafficApp(tk.Tk):
                     canvas.itemconfig(items[0], width=new_width)
             self.sidebar_width = new_width
     
-    def _update_canvas_dimensions(self):
-        """Update cached canvas dimensions"""
-        try:
-            w = self.canvas.winfo_width()
-            h = self.canvas.winfo_height()
-            if w > 10 and h > 10:
-                if w != self.canvas_width or h != self.canvas_height:
-                    self.canvas_width = w
-                    self.canvas_height = h
-                    for car in self.cars:
-                        car.update_canvas_size(w, h)
-        except:
-            pass
+    def _on_canvas_configure(self, event):
+        """Update cached canvas dimensions when the main canvas is resized"""
+        w, h = event.width, event.height
+        if w > 10 and h > 10:
+            if w != self.canvas_width or h != self.canvas_height:
+                self.canvas_width = w
+                self.canvas_height = h
+                for car in self.all_cars():
+                    car.update_canvas_size(w, h)
+                self._layout_canvas()
 
     # =========================================================================
     # SIMULATION LOOP
@@ -660,58 +740,54 @@ class UltimateTrafficApp(tk.Tk):
     
     def run_simulation(self):
         """Main simulation loop"""
-        current_time = time.time()
+        # Monotonic clock throughout: frame deltas and 60 sec windows are
+        # immune to wall-clock adjustments
+        current_time = time.monotonic()
         delta = current_time - self.last_frame_time
         self.last_frame_time = current_time
         if delta > 0.1:
             delta = 0.016
         
-        if not hasattr(self, '_dim_update_counter'):
-            self._dim_update_counter = 0
-        self._dim_update_counter += 1
-        if self._dim_update_counter >= 30:
-            self._dim_update_counter = 0
-            self._update_canvas_dimensions()
-        
         # Spawn cars based on demand
-        target_cpm = self.rate_var.get()
+        target_cpm = self._target_cpm
         target_cps = target_cpm / 60.0
         self.spawn_credit += target_cps * delta
         
-        spawn_limit = 10
-        while self.spawn_credit >= 1.0 and spawn_limit > 0:
-            self.spawn_credit -= 1.0
-            lane = random.choice(['N', 'S', 'E', 'W'])
-            if self.can_spawn_freely(lane):
-                self.spawn_car_direct(lane)
-            else:
-                self.virtual_queues[lane] += 1
-            spawn_limit -= 1
+        # At most 10 spawns per frame; draw all their lanes in one call
+        spawn_count = min(int(self.spawn_credit), 10)
+        if spawn_count > 0:
+            self.spawn_credit -= spawn_count
+            for lane in random.choices(LANES, k=spawn_count):
+                if self.can_spawn_freely(lane):
+                    self.spawn_car_direct(lane)
+                else:
+                    self.virtual_queues[lane] += 1
         
-        self.update_physics()
-        self.manage_virtual_queues()
+        self.update_physics(current_time)
         
-        # Calculate queue states
-        queues = {'N': 0, 'S': 0, 'E': 0, 'W': 0}
-        max_wait_ticks = 0
+        # Calculate queue states: cars on the road plus the overflow waiting off-screen.
+        # Spawned cars are never virtual, so each lane's deque length is its road count
+        lane_cars, virtual = self.lane_cars, self.virtual_queues
+        queues = {lane: len(lane_cars[lane]) + virtual[lane] for lane in LANES}
+        max_wait_sec = self.max_wait_ticks / 60.0
         
-        for c in self.cars:
-            if not c.is_virtual:
-                queues[c.lane] += 1
-                seconds_waiting = c.wait_time / 60.0
-                if seconds_waiting > max_wait_ticks:
-                    max_wait_ticks = seconds_waiting
+        flow_ratio = self.current_flow / max(self.target_flow, 1.0)
         
-        for lane in queues:
-            queues[lane] += self.virtual_queues[lane]
+        self.update_fsm(queues, max_wait_sec, flow_ratio)
         
-        flow_ratio = self.current_flow / max(self.target_flow, 1.0)
+        # Drop samples older than 60 sec a few times a second rather than every frame
+        self._prune_counter += 1
+        if self._prune_counter >= 15:
+            self._prune_counter = 0
+            self.prune_history(current_time - 60)
         
-        self.update_fsm(queues, max_wait_ticks, flow_ratio)
-        self.calculate_flow_metrics()
+        self.calculate_flow_metrics(current_time)
         self.draw(queues)
         
-        self.after(16, self.run_simulation)
+        # Aim for a steady 16 ms cadence: subtract the time this frame took,
+        # but always yield at least 1 ms so a slow frame can't starve Tk
+        elapsed_ms = int((time.monotonic() - current_time) * 1000)
+        self.after(max(1, 16 - elapsed_ms), self.run_simulation)
 
     # =========================================================================
     # FSM (FINITE STATE MACHINE)
@@ -720,14 +796,17 @@ class UltimateTrafficApp(tk.Tk):
     def update_fsm(self, queues, max_wait_time_sec, flow_ratio):
         """Update traffic light state machine"""
         self.state_timer += 1
-        active_lane = self.phase_order[self.current_phase_idx]
+        i = self.current_phase_idx
+        active_lane = self.phase_order[i]
         active_load = queues[active_lane]
         
-        waiting_loads = [queues[l] for l in self.phase_order if l != active_lane]
-        max_waiting = max(waiting_loads) if waiting_loads else 0
+        # Largest queue among the red lanes
+        a, b, c = self._OTHERS[i]
+        max_waiting = max(queues[a], queues[b], queues[c])
         
         # Calculate fuzzy logic
-        score, mu_a, mu_b, mu_c, mu_f, rules, sets = self.fuzzy_controller.calculate(
+        fuzzy = self.fuzzy_controller
+        score, mu_a, mu_b, mu_c, mu_f, rules, sets = fuzzy.calculate(
             active_load, max_waiting, max_wait_time_sec, flow_ratio
         )
         
@@ -767,19 +846,31 @@ class UltimateTrafficApp(tk.Tk):
                 self.lights[active_lane] = 'red'
                 
         elif self.fsm_state == 'ALL_RED':
-            cx, cy = self.canvas_width / 2, self.canvas_height / 2
-            occupied = any(cx - 100 < c.x < cx + 100 and cy - 100 < c.y < cy + 100 for c in self.cars)
-            if not occupied and self.state_timer > 15:
+            if self.cars_in_intersection == 0 and self.state_timer > 15:
                 self.current_phase_idx = (self.current_phase_idx + 1) % 4
                 self.fsm_state = 'GREEN'
                 self.state_timer = 0
         
-        # Calculate derived inputs for visualization
-        clearance_time = active_load * 2.0  # SATURATION_HEADWAY = 2.0 sec
-        imbalance_ratio = max_waiting / (active_load + 1)
-        urgency_index = (max_wait_time_sec / 45.0) * (1 + max_waiting / 10.0)
+        # Derived inputs for visualization, as computed by the controller
+        clearance_time, imbalance_ratio, urgency_index = fuzzy.last_inputs
+        
+        # Fuzzy panels are drawn by _draw_slow_overlays. Memberships and rules
+        # follow from the inputs, so only redraw when a quantized input or the
+        # score moves visibly
+        key = (clearance_time, round(imbalance_ratio, 2), round(urgency_index, 2), round(score, 1))
+        if key != self._fuzzy_key:
+            self._fuzzy_key = key
+            self._fuzzy_view = (clearance_time, imbalance_ratio, urgency_index, mu_a, mu_b, mu_c,
+                                score, rules, sets, switch_threshold)
+            self._overlays_dirty = True
+    
+    def draw_fuzzy_panels(self):
+        """Draw the fuzzy engine tab from the last FSM evaluation"""
+        if self._fuzzy_view is None:
+            return
+        (clearance_time, imbalance_ratio, urgency_index, mu_a, mu_b, mu_c,
+         score, rules, sets, switch_threshold) = self._fuzzy_view
         
-        # Update fuzzy visualizations with new realistic inputs
         self.fuzzy_viz.draw_membership_3(
             self.cv_input_a, "Clearance (sec)", clearance_time, mu_a,
             sets[0], sets[1], sets[2], 60
@@ -816,14 +907,11 @@ class UltimateTrafficApp(tk.Tk):
                 continue
             row = self.rule_rows[rule_id]
             canvas = row['canvas']
-            value_lbl = row['value_lbl']
-            color = row['color']
             
             # Update value label
-            value_lbl.config(text=f"{value:.2f}")
+            self._set_label(row['value_lbl'], text=f"{value:.2f}")
             
-            # Draw bar on canvas
-            canvas.delete("all")
+            # Move the bar's items into place
             w = canvas.winfo_width()
             h = canvas.winfo_height()
             if w < 10:
@@ -832,68 +920,68 @@ class UltimateTrafficApp(tk.Tk):
                 h = 14
             
             # Background
-            canvas.create_rectangle(0, 0, w, h, fill=BG_DARK, outline="")
+            canvas.coords(row['track'], 0, 0, w, h)
             
             # Fill bar (max value is 2.0 for scaling)
             bar_width = w * min(value, 2.0) / 2.0
-            canvas.create_rectangle(0, 0, bar_width, h, fill=color, outline="")
+            canvas.coords(row['fill'], 0, 0, bar_width, h)
 
     # =========================================================================
     # PHYSICS & SPAWNING
     # =========================================================================
     
+    def all_cars(self):
+        """Iterate over every car on the road, lane by lane"""
+        for cars in self.lane_cars.values():
+            yield from cars
+    
     def can_spawn_freely(self, lane):
         """Check if a car can spawn without collision"""
-        w, h = self.canvas_width, self.canvas_height
-        for c in self.cars:
-            if c.lane == lane and not c.is_virtual:
-                dist = 0
-                if lane == 'N':
-                    dist = abs(c.y - (-20))
-                elif lane == 'S':
-                    dist = abs(c.y - (h + 20))
-                elif lane == 'W':
-                    dist = abs(c.x - (-20))
-                elif lane == 'E':
-                    dist = abs(c.x - (w + 20))
-                if dist < 16:
-                    return False
-        return True
+        # Clearance is measured from where Car places a new car (50px off the
+        # canvas edge). Cars never overtake, so the lane's last spawned car is
+        # the one nearest that point and the only one that can block it
+        cars = self.lane_cars[lane]
+        if not cars or cars[-1].is_virtual:
+            return True
+        c = cars[-1]
+        if lane == 'N':
+            dist = c.y - (-50)
+        elif lane == 'S':
+            dist = (self.canvas_height + 50) - c.y
+        elif lane == 'W':
+            dist = c.x - (-50)
+        else:
+            dist = (self.canvas_width + 50) - c.x
+        # Same 24px gap at which Car.update stops a follower
+        return dist >= 24
     
     def spawn_car_direct(self, lane):
         """Spawn a car directly on the road"""
-        if not hasattr(self, 'start_time'):
-            self.start_time = time.time()
-        self.cars.append(Car(lane, self.canvas_width, self.canvas_height))
-    
-    def manage_virtual_queues(self):
-        """Move cars from virtual queues to road when space is available"""
-        for lane in ['N', 'S', 'E', 'W']:
-            if self.virtual_queues[lane] > 0:
-                if self.can_spawn_freely(lane):
-                    self.virtual_queues[lane] -= 1
-                    self.spawn_car_direct(lane)
+        if self.start_time is None:
+            self.start_time = time.monotonic()
+        self.lane_cars[lane].append(Car(lane, self.canvas_width, self.canvas_height))
     
-    def update_physics(self):
-        """Update car positions and handle exits"""
-        lane_cars = {'N': [], 'S': [], 'E': [], 'W': []}
-        for c in self.cars:
-            lane_cars[c.lane].append(c)
-        
-        lane_cars['N'].sort(key=lambda c: c.y, reverse=True)
-        lane_cars['S'].sort(key=lambda c: c.y)
-        lane_cars['W'].sort(key=lambda c: c.x, reverse=True)
-        lane_cars['E'].sort(key=lambda c: c.x)
-        
+    def update_physics(self, now):
+        """Update car positions, handle exits and release virtual queues"""
         w, h = self.canvas_width, self.canvas_height
         cx, cy = w / 2, h / 2
         
-        alive = []
-        for lane in ['N', 'S', 'E', 'W']:
+        # Walk each lane front-to-back; the car ahead is simply the previous one
+        step = Car.update
+        virtual = self.virtual_queues
+        max_wait = 0
+        in_box = 0
+        for lane in LANES:
             light = self.lights[lane]
-            for i, car in enumerate(lane_cars[lane]):
-                car_ahead = lane_cars[lane][i - 1] if i > 0 else None
-                car.update(light, car_ahead)
+            cars = self.lane_cars[lane]
+            car_ahead = None
+            for car in cars:
+                step(car, light, car_ahead)
+                car_ahead = car
+                if car.wait_time > max_wait:
+                    max_wait = car.wait_time
+                if cx - 100 < car.x < cx + 100 and cy - 100 < car.y < cy + 100:
+                    in_box += 1
                 
                 # Count car when it passes through intersection center
                 if not car.counted:
@@ -909,53 +997,94 @@ class UltimateTrafficApp(tk.Tk):
                     
                     if passed:
                         car.counted = True
-                        now = time.time()
                         self.exit_timestamps.append(now)
                         # Track wait time for this lane (convert ticks to seconds)
-                        wait_sec = car.wait_time / 60.0
-                        self.lane_wait_times[lane].append(wait_sec)
-                        # Also track with timestamp for max wait calculation
-                        self.lane_wait_history[lane].append((now, wait_sec))
-                
-                # Keep car alive until it leaves canvas
-                if -100 < car.x < w + 100 and -100 < car.y < h + 100:
-                    alive.append(car)
-        self.cars = alive
+                        self.lane_wait_stats[lane].record(now, car.wait_time / 60.0)
+                        self._overlays_dirty = True
+            
+            # Keep cars alive until they leave the canvas; the front car always leaves first.
+            # Cars only move along their lane's axis, so only that coordinate can run off
+            if lane == 'N' or lane == 'S':
+                while cars and not -100 < cars[0].y < h + 100:
+                    cars.popleft()
+            else:
+                while cars and not -100 < cars[0].x < w + 100:
+                    cars.popleft()
+            
+            # Move one car from the virtual queue onto the road once the entry is clear
+            if virtual[lane] > 0 and self.can_spawn_freely(lane):
+                virtual[lane] -= 1
+                self.spawn_car_direct(lane)
+        self.max_wait_ticks = max_wait
+        self.cars_in_intersection = in_box
 
     # =========================================================================
     # METRICS
     # =========================================================================
     
-    def calculate_flow_metrics(self):
-        """Calculate and display flow metrics"""
-        now = time.time()
-        while self.exit_timestamps and self.exit_timestamps[0] < now - 60:
-            self.exit_timestamps.popleft()
-        
+    def prune_history(self, cutoff):
+        """Drop exit timestamps and lane wait peaks recorded before cutoff"""
+        pruned = False
+        stamps = self.exit_timestamps
+        if stamps and stamps[0] < cutoff:
+            # Stamps are appended in time order: one search finds how many expired
+            for _ in range(bisect_left(stamps, cutoff)):
+                stamps.popleft()
+            pruned = True
+        for stats in self.lane_wait_stats.values():
+            if stats.prune(cutoff):
+                pruned = True
+        if pruned:
+            # Max(60s) and the lane stats shown may have just expired
+            self._overlays_dirty = True
+    
+    def calculate_flow_metrics(self, now):
+        """Calculate flow metrics; the dashboard itself is drawn by _draw_slow_overlays"""
         count = len(self.exit_timestamps)
-        elapsed = now - self.start_time if hasattr(self, 'start_time') else 1
+        elapsed = now - self.start_time if self.start_time is not None else 1
         
-        self.current_flow = (count / elapsed) * 60 if elapsed < 60 and elapsed > 1 else float(count)
-        
-        self.lbl_my_flow.config(text=f"{self.current_flow:.1f}")
+        flow = (count / elapsed) * 60 if elapsed < 60 and elapsed > 1 else float(count)
+        if flow != self.current_flow:
+            self.current_flow = flow
+            self._overlays_dirty = True
         self.update_capacity_estimate()
         
-        if self.target_flow > 0:
-            satisfaction = (self.current_flow / self.target_flow) * 100
-            self.lbl_efficiency.config(text=f"{satisfaction:.0f}%", foreground=get_efficiency_color(satisfaction))
-        
-        status_text, status_color = get_flow_status(self.current_flow, self.target_flow)
-        self.lbl_flow_status.config(text=status_text, foreground=status_color)
-        
-        self.draw_gauge()
-        
         if now - self.history_update_time >= 1.0:
             self.history_update_time = now
             self.throughput_history.append(self.current_flow)
-            self.draw_history_graph()
+            if self._sidebar_tab == 0:
+                self.draw_history_graph()
+    
+    def _draw_slow_overlays(self):
+        """Redraw the dashboard and fuzzy panels a few times per second"""
+        if self._overlays_dirty:
+            self._overlays_dirty = False
+            # Hidden tabs are skipped; switching tabs marks everything dirty again
+            if self._sidebar_tab == 0:
+                self.update_flow_labels()
+                self.draw_gauge()
+                self.update_lane_stats()
+                self.update_realworld_comparison()
+            else:
+                self.draw_fuzzy_panels()
+        self.after(250, self._draw_slow_overlays)
+    
+    def update_flow_labels(self):
+        """Update the flow and efficiency labels"""
+        self._set_label(self.lbl_my_flow, text=f"{self.current_flow:.1f}")
         
-        self.update_lane_stats()
-        self.update_realworld_comparison()
+        if self.target_flow > 0:
+            satisfaction = (self.current_flow / self.target_flow) * 100
+            color = get_efficiency_color(satisfaction)
+            self._set_label(self.lbl_efficiency, text=f"{satisfaction:.0f}%", foreground=color)
+        # lbl_flow_status is set by update_realworld_comparison, which runs right after
+    
+    def _set_label(self, label, **options):
+        """Configure a label only if its options differ from what it already shows"""
+        state = tuple(options.items())
+        if self._label_state.get(label) != state:
+            self._label_state[label] = state
+            label.config(**options)
     
     def update_realworld_comparison(self):
         """Update real-world throughput comparison in Flow Analyzer"""
@@ -969,7 +1098,7 @@ class UltimateTrafficApp(tk.Tk):
         self.realworld_expected_low = expected_rw_low
         self.realworld_expected_high = expected_rw_high
         
-        self.lbl_realworld.config(text=f"{expected_rw_low:.0f}-{expected_rw_high:.0f}")
+        self._set_label(self.lbl_realworld, text=f"{expected_rw_low:.0f}-{expected_rw_high:.0f}")
         
         if flow < expected_rw_low:
             perc = ((expected_rw_low - flow) / expected_rw_low) * 100 if expected_rw_low > 0 else 0
@@ -980,14 +1109,14 @@ class UltimateTrafficApp(tk.Tk):
             perc = ((flow - expected_rw_high) / expected_rw_high) * 100 if expected_rw_high > 0 else 0
             comp_text, comp_color = f"+{perc:.0f}% vs Real", ACCENT_PRIMARY
         
-        self.lbl_comparison.config(text=comp_text, foreground=comp_color)
+        self._set_label(self.lbl_comparison, text=comp_text, foreground=comp_color)
         
         ratio = flow / max(demand, 1)
         if ratio >= 0.95: status, color = "Meeting demand ✓", STATUS_GOOD
         elif ratio >= 0.8: status, color = f"{ratio*100:.0f}% of demand", STATUS_WARNING
         else: status, color = "Under capacity", STATUS_ERROR
         
-        self.lbl_flow_status.config(text=status, foreground=color)
+        self._set_label(self.lbl_flow_status, text=status, foreground=color)
     
     def update_capacity_estimate(self):
         """Calculate theoretical intersection capacity based on current conditions"""
@@ -996,49 +1125,89 @@ class UltimateTrafficApp(tk.Tk):
         green_efficiency = 0.25 + (demand_factor * 0.15)
         self.theoretical_capacity = saturation_flow_per_lane * green_efficiency * 4
     
+    def _create_gauge_items(self, c):
+        """Create the gauge's canvas items once; draw_gauge moves and restyles them"""
+        micro = theme.get_font(theme.FONT_MICRO)
+        return {
+            'rw_band': c.create_rectangle(0, 0, 0, 0, fill='#1a3a2a', outline=""),
+            'rw_min': c.create_line(0, 0, 0, 0, fill=ACCENT_TERTIARY, width=2),
+            'rw_max': c.create_line(0, 0, 0, 0, fill=ACCENT_TERTIARY, width=2),
+            'rw_base': c.create_line(0, 0, 0, 0, fill=ACCENT_TERTIARY, width=1, dash=(2,2)),
+            'rw_text': c.create_text(0, 0, text="Real-World", fill=ACCENT_TERTIARY, font=micro, anchor='s'),
+            'demand_line': c.create_line(0, 0, 0, 0, fill=GAUGE_DEMAND_LINE, width=3),
+            'demand_mark': c.create_polygon(0, 0, 0, 0, 0, 0, fill=GAUGE_DEMAND_LINE),
+            'demand_text': c.create_text(0, 0, fill=GAUGE_DEMAND_LINE, font=micro, anchor='s'),
+            'bar': c.create_rectangle(0, 0, 0, 0, outline=ACCENT_PRIMARY, width=1),
+            'bar_text': c.create_text(0, 0, fill=TEXT_PRIMARY, font=theme.get_font(theme.FONT_LABEL_BOLD), anchor='w'),
+            'ticks': [
+                (c.create_line(0, 0, 0, 0, fill=TEXT_MUTED, width=1),
+                 c.create_text(0, 0, text=str(val), fill=TEXT_MUTED, font=micro, anchor='n'))
+                for val in self._GAUGE_TICKS
+            ],
+        }
+    
     def draw_gauge(self):
         """Draw the flow gauge with Simulation, Demand, and Real-World indicators"""
         c = self.gauge_canvas
-        c.delete("all")
+        items = self._gauge_items
+        coords, itemconfig = c.coords, c.itemconfig
         
         w = c.winfo_width()
         h = c.winfo_height()
         if w < 50: w = 400
         if h < 10: h = 45
         
-        rw_min = getattr(self, 'realworld_expected_low', self.target_flow * 0.7)
-        rw_max = getattr(self, 'realworld_expected_high', self.target_flow * 0.9)
+        rw_min = self.realworld_expected_low
+        rw_max = self.realworld_expected_high
+        
+        # Nothing to move if the inputs are unchanged at display precision
+        key = (round(self.current_flow, 1), round(self.target_flow, 1), w, h, round(rw_min, 1), round(rw_max, 1))
+        if key == self._gauge_key:
+            return
+        self._gauge_key = key
+        
         max_scale = max(self.target_flow, rw_max, self.current_flow, 50) * 1.15
         
-        def to_x(val): return (val / max_scale) * w
+        # Whole pixels: Tk stringifies every coordinate, ints are cheaper and shorter
+        def to_x(val): return int(val / max_scale * w)
         
         rw_min_x, rw_max_x = to_x(rw_min), to_x(rw_max)
-        c.create_rectangle(rw_min_x, 0, rw_max_x, h, fill='#1a3a2a', outline="")
+        coords(items['rw_band'], rw_min_x, 0, rw_max_x, h)
         
-        c.create_line(rw_min_x, 5, rw_min_x, h-5, fill=ACCENT_TERTIARY, width=2)
-        c.create_line(rw_max_x, 5, rw_max_x, h-5, fill=ACCENT_TERTIARY, width=2)
-        c.create_line(rw_min_x, h-5, rw_max_x, h-5, fill=ACCENT_TERTIARY, width=1, dash=(2,2))
-        c.create_text((rw_min_x + rw_max_x)/2, h-2, text="Real-World", fill=ACCENT_TERTIARY, font=theme.FONT_MICRO, anchor='s')
+        coords(items['rw_min'], rw_min_x, 5, rw_min_x, h-5)
+        coords(items['rw_max'], rw_max_x, 5, rw_max_x, h-5)
+        coords(items['rw_base'], rw_min_x, h-5, rw_max_x, h-5)
+        coords(items['rw_text'], (rw_min_x + rw_max_x)/2, h-2)
         
         demand_x = to_x(self.target_flow)
-        c.create_line(demand_x, 3, demand_x, h-8, fill=GAUGE_DEMAND_LINE, width=3)
-        c.create_polygon(demand_x-5, 3, demand_x+5, 3, demand_x, 10, fill=GAUGE_DEMAND_LINE)
-        c.create_text(demand_x, 3, text=f"{self.target_flow:.0f}", fill=GAUGE_DEMAND_LINE, font=theme.FONT_MICRO, anchor='s')
+        coords(items['demand_line'], demand_x, 3, demand_x, h-8)
+        coords(items['demand_mark'], demand_x-5, 3, demand_x+5, 3, demand_x, 10)
+        coords(items['demand_text'], demand_x, 3)
+        itemconfig(items['demand_text'], text=f"{self.target_flow:.0f}")
         
         flow_x = min(to_x(self.current_flow), w - 2)
         bar_y1, bar_y2 = 15, h - 12
         ratio = self.current_flow / max(self.target_flow, 1)
         bar_color = STATUS_GOOD if ratio >= 0.9 else (STATUS_WARNING if ratio >= 0.7 else STATUS_ERROR)
-        c.create_rectangle(2, bar_y1, flow_x, bar_y2, fill=bar_color, outline=ACCENT_PRIMARY, width=1)
+        coords(items['bar'], 2, bar_y1, flow_x, bar_y2)
+        itemconfig(items['bar'], fill=bar_color)
         
-        c.create_text(flow_x + 5, (bar_y1+bar_y2)/2, text=f"{self.current_flow:.0f}", fill=TEXT_PRIMARY, font=theme.FONT_LABEL_BOLD, anchor='w')
+        coords(items['bar_text'], flow_x + 5, (bar_y1+bar_y2)/2)
+        itemconfig(items['bar_text'], text=f"{self.current_flow:.0f}")
         
-        for val in [0, 25, 50, 75, 100]:
+        for val, (tick, label) in zip(self._GAUGE_TICKS, items['ticks']):
             if val <= max_scale:
                 x = to_x(val)
-                c.create_line(x, h-3, x, h, fill=TEXT_MUTED, width=1)
+                coords(tick, x, h-3, x, h)
+                itemconfig(tick, state='normal')
                 if 0 < val < max_scale * 0.95:
-                    c.create_text(x, h, text=str(val), fill=TEXT_MUTED, font=theme.FONT_MICRO, anchor='n')
+                    coords(label, x, h)
+                    itemconfig(label, state='normal')
+                else:
+                    itemconfig(label, state='hidden')
+            else:
+                itemconfig(tick, state='hidden')
+                itemconfig(label, state='hidden')
 
     # =========================================================================
     # LANE STATISTICS & LEVEL OF SERVICE
@@ -1046,24 +1215,16 @@ class UltimateTrafficApp(tk.Tk):
     
     def get_los_grade(self, avg_delay):
         """Calculate Level of Service (LOS) based on average delay (HCM criteria)."""
-        if avg_delay <= 10: return 'A', 'Free Flow', STATUS_GOOD
-        if avg_delay <= 20: return 'B', 'Stable', STATUS_GOOD
-        if avg_delay <= 35: return 'C', 'Acceptable', STATUS_WARNING
-        if avg_delay <= 55: return 'D', 'Unstable', STATUS_WARNING
-        if avg_delay <= 80: return 'E', 'Poor', STATUS_ERROR
-        return 'F', 'Failure', STATUS_ERROR
+        return LOS_GRADES[bisect_left(LOS_THRESHOLDS, avg_delay)]
     
     def update_lane_stats(self):
         """Update lane statistics display"""
-        now = time.time()
         total_wait, total_count, overall_max_wait = 0, 0, 0
         
-        for lane in ['N', 'S', 'E', 'W']:
-            while self.lane_wait_history[lane] and self.lane_wait_history[lane][0][0] < now - 60:
-                self.lane_wait_history[lane].popleft()
-            
-            avg_wait = sum(self.lane_wait_times[lane]) / len(self.lane_wait_times[lane]) if self.lane_wait_times[lane] else 0
-            max_wait = max(entry[1] for entry in self.lane_wait_history[lane]) if self.lane_wait_history[lane] else 0
+        for lane in LANES:
+            stats = self.lane_wait_stats[lane]
+            avg_wait = stats.mean
+            max_wait = stats.max
             
             overall_max_wait = max(overall_max_wait, max_wait)
             self.lane_mean_wait[lane] = avg_wait
@@ -1073,20 +1234,36 @@ class UltimateTrafficApp(tk.Tk):
             grade, desc, color = self.get_los_grade(avg_wait)
             max_color = STATUS_GOOD if max_wait <= 20 else (STATUS_WARNING if max_wait <= 45 else STATUS_ERROR)
             
-            self.lane_labels[lane]['wait'].config(text=f"{avg_wait:.1f}s")
-            self.lane_labels[lane]['max_wait'].config(text=f"{max_wait:.1f}s", foreground=max_color)
-            self.lane_labels[lane]['los'].config(text=grade, foreground=color)
-            self.lane_labels[lane]['grade'].config(text=desc, foreground=color)
+            labels = self.lane_labels[lane]
+            self._set_label(labels['wait'], text=f"{avg_wait:.1f}s")
+            self._set_label(labels['max_wait'], text=f"{max_wait:.1f}s", foreground=max_color)
+            self._set_label(labels['los'], text=grade, foreground=color)
+            self._set_label(labels['grade'], text=desc, foreground=color)
         
         overall_avg = total_wait / total_count if total_count > 0 else 0
         grade, desc, color = self.get_los_grade(overall_avg)
-        self.lbl_overall_los.config(text=grade, foreground=color)
-        self.lbl_overall_desc.config(text=f"{desc} (avg:{overall_avg:.0f}s max:{overall_max_wait:.0f}s)", foreground=color)
+        self._set_label(self.lbl_overall_los, text=grade, foreground=color)
+        self._set_label(self.lbl_overall_desc, text=f"{desc} (avg:{overall_avg:.0f}s max:{overall_max_wait:.0f}s)", foreground=color)
+    
+    def _create_history_items(self, c):
+        """Create the history graph's canvas items once; draw_history_graph moves them"""
+        micro = theme.get_font(theme.FONT_MICRO)
+        return {
+            'grid': [c.create_line(0, 0, 0, 0, fill=BORDER_DARK, dash=(2, 4)) for _ in range(5)],
+            'demand_line': c.create_line(0, 0, 0, 0, fill=GAUGE_DEMAND_LINE, width=1, dash=(4, 2)),
+            'demand_text': c.create_text(0, 0, text="Dem", fill=GAUGE_DEMAND_LINE, font=micro, anchor='w'),
+            'line': c.create_line(0, 0, 0, 0, fill=ACCENT_PRIMARY, width=2, smooth=True, state='hidden'),
+            'dot': c.create_oval(0, 0, 0, 0, fill=ACCENT_PRIMARY, outline=TEXT_PRIMARY, state='hidden'),
+            'max_text': c.create_text(0, 0, fill=TEXT_MUTED, font=micro, anchor='e'),
+            'zero_text': c.create_text(0, 0, text="0", fill=TEXT_MUTED, font=micro, anchor='e'),
+            'flow_text': c.create_text(0, 0, fill=TEXT_PRIMARY, font=theme.get_font(theme.FONT_VALUE_SMALL), anchor='ne'),
+        }
     
     def draw_history_graph(self):
         """Draw throughput history line graph"""
         c = self.cv_history
-        c.delete("all")
+        items = self._history_items
+        coords, itemconfig = c.coords, c.itemconfig
         
         w, h = c.winfo_width(), c.winfo_height()
         if w < 50: w = 400
@@ -1098,23 +1275,45 @@ class UltimateTrafficApp(tk.Tk):
         
         max_val = max(max(self.throughput_history) if self.throughput_history else 0, self.target_flow, 10) * 1.1
         
-        for i in range(5): c.create_line(pad, pad + (gh * i / 4), pad + gw, pad + (gh * i / 4), fill=BORDER_DARK, dash=(2, 4))
+        for i, line in enumerate(items['grid']):
+            coords(line, pad, pad + (gh * i / 4), pad + gw, pad + (gh * i / 4))
         
         demand_y = pad + gh - (self.target_flow / max_val * gh)
-        c.create_line(pad, demand_y, pad + gw, demand_y, fill=GAUGE_DEMAND_LINE, width=1, dash=(4, 2))
-        c.create_text(pad + gw + 2, demand_y, text="Dem", fill=GAUGE_DEMAND_LINE, font=theme.FONT_MICRO, anchor='w')
+        coords(items['demand_line'], pad, demand_y, pad + gw, demand_y)
+        coords(items['demand_text'], pad + gw + 2, demand_y)
         
         if len(self.throughput_history) > 1:
             n = len(self.throughput_history)
-            points = [item for i, val in enumerate(self.throughput_history) for item in (pad + (i / (n - 1)) * gw if n > 1 else pad, pad + gh - (val / max_val * gh))]
-            c.create_line(points, fill=ACCENT_PRIMARY, width=2, smooth=True)
-            if points:
-                lx, ly = points[-2], points[-1]
-                c.create_oval(lx - 4, ly - 4, lx + 4, ly + 4, fill=ACCENT_PRIMARY, outline=TEXT_PRIMARY)
-        
-        c.create_text(pad - 2, pad, text=f"{int(max_val)}", fill=TEXT_MUTED, font=theme.FONT_MICRO, anchor='e')
-        c.create_text(pad - 2, pad + gh, text="0", fill=TEXT_MUTED, font=theme.FONT_MICRO, anchor='e')
-        c.create_text(pad + gw - 5, pad + 5, text=f"{self.current_flow:.1f}", fill=TEXT_PRIMARY, font=theme.FONT_VALUE_SMALL, anchor='ne')
+            # x positions (and which samples to plot) only depend on the sample
+            # count and width, so reuse them. Never plot more than one point per
+            # horizontal pixel; narrower graphs get evenly picked samples
+            if self._history_xs_key != (n, gw):
+                m = min(n, gw)
+                step = gw / (m - 1)
+                self._history_xs = [int(pad + i * step) for i in range(m)]
+                self._history_idx = None if m == n else [round(i * (n - 1) / (m - 1)) for i in range(m)]
+                self._history_xs_key = (n, gw)
+            
+            vals = self.throughput_history
+            if self._history_idx is not None:
+                vals = [vals[i] for i in self._history_idx]
+            
+            # Whole-pixel coordinates: cheaper for Tk to parse than float strings
+            base, scale = pad + gh, gh / max_val
+            points = [0] * (2 * len(self._history_xs))
+            points[0::2] = self._history_xs
+            points[1::2] = [int(base - val * scale) for val in vals]
+            coords(items['line'], points)
+            lx, ly = points[-2], points[-1]
+            coords(items['dot'], lx - 4, ly - 4, lx + 4, ly + 4)
+            itemconfig(items['line'], state='normal')
+            itemconfig(items['dot'], state='normal')
+        
+        coords(items['max_text'], pad - 2, pad)
+        itemconfig(items['max_text'], text=f"{int(max_val)}")
+        coords(items['zero_text'], pad - 2, pad + gh)
+        coords(items['flow_text'], pad + gw - 5, pad + 5)
+        itemconfig(items['flow_text'], text=f"{self.current_flow:.1f}")
 
     # =========================================================================
     # DRAWING
@@ -1123,50 +1322,137 @@ class UltimateTrafficApp(tk.Tk):
     def draw(self, queues):
         """Draw the main traffic simulation canvas"""
         c = self.canvas
-        c.delete("all")
+        # All items are persistent and only move on resize (_layout_canvas);
+        # per frame they are just restyled
         
-        w, h = self.canvas_width, self.canvas_height
-        cx, cy = w / 2, h / 2
-        rw = max(80, min(min(w, h) * 0.15, 150))
+        # Overflow markers: only touch the ones whose visibility flipped
+        vq, shown = self.virtual_queues, self._overflow_shown
+        for lane in LANES:
+            on = vq[lane] > 0
+            if on != shown[lane]:
+                shown[lane] = on
+                c.itemconfig(self._overflow_items[lane], state='normal' if on else 'hidden')
         
-        c.create_rectangle(cx - rw / 2, 0, cx + rw / 2, h, fill=BG_ROAD, outline="")
-        c.create_rectangle(0, cy - rw / 2, w, cy + rw / 2, fill=BG_ROAD, outline="")
-        c.create_rectangle(cx - rw / 2, cy - rw / 2, cx + rw / 2, cy + rw / 2, fill=BG_INTERSECTION, outline=TEXT_PRIMARY, dash=(2, 2))
+        self._draw_cars(c)
         
-        if self.virtual_queues['N'] > 0: c.create_rectangle(cx - 20, 0, cx + 20, 10, fill=OVERFLOW_QUEUE)
-        if self.virtual_queues['S'] > 0: c.create_rectangle(cx - 20, h - 10, cx + 20, h, fill=OVERFLOW_QUEUE)
-        if self.virtual_queues['W'] > 0: c.create_rectangle(0, cy + 20, 10, cy - 20, fill=OVERFLOW_QUEUE)
-        if self.virtual_queues['E'] > 0: c.create_rectangle(w - 10, cy + 20, w, cy - 20, fill=OVERFLOW_QUEUE)
+        last_q = self._queue_shown
+        for lane, total_q in queues.items():
+            if total_q != last_q[lane]:
+                last_q[lane] = total_q
+                c.itemconfig(self._queue_items[lane], text=f"Q: {total_q}")
         
-        for car in self.cars:
-            if not car.is_virtual:
-                c.create_rectangle(car.x - 6, car.y - 6, car.x + 6, car.y + 6, fill=car.get_color(), outline="black")
+        for lane in LANES:
+            self._draw_light(c, lane)
+    
+    def _create_canvas_items(self, c):
+        """Create the persistent road, overflow, queue label and light items on the main canvas"""
+        # Created first so they sit beneath the cars and everything else
+        self._road_items = (
+            c.create_rectangle(0, 0, 0, 0, fill=BG_ROAD, outline=""),
+            c.create_rectangle(0, 0, 0, 0, fill=BG_ROAD, outline=""),
+            c.create_rectangle(0, 0, 0, 0, fill=BG_INTERSECTION, outline=TEXT_PRIMARY, dash=(2, 2)),
+        )
+        self._overflow_items = {
+            lane: c.create_rectangle(0, 0, 0, 0, fill=OVERFLOW_QUEUE, state='hidden')
+            for lane in LANES
+        }
+        self._overflow_shown = {lane: False for lane in LANES}
         
-        for lane, total_q in queues.items():
-            txt, pos = f"Q: {total_q}", (0, 0)
-            if lane == 'N': pos = (cx, cy - rw / 2 - 50)
-            elif lane == 'S': pos = (cx, cy + rw / 2 + 50)
-            elif lane == 'W': pos = (cx - rw / 2 - 50, cy)
-            elif lane == 'E': pos = (cx + rw / 2 + 50, cy)
-            c.create_text(pos, text=txt, fill=TEXT_PRIMARY, font=theme.FONT_VALUE_SMALL)
-        
-        self._draw_light(c, 'N', cx - rw / 2 - 25, cy - rw / 2 - 25)
-        self._draw_light(c, 'S', cx + rw / 2 + 25, cy + rw / 2 + 25)
-        self._draw_light(c, 'W', cx - rw / 2 - 25, cy + rw / 2 + 25)
-        self._draw_light(c, 'E', cx + rw / 2 + 25, cy - rw / 2 - 25)
+        # Everything tagged 'overlay' stays above the pooled car items
+        self._queue_items = {
+            lane: c.create_text(0, 0, fill=TEXT_PRIMARY, font=theme.get_font(theme.FONT_VALUE_SMALL), tags=('overlay', 'queue'))
+            for lane in LANES
+        }
+        self._queue_shown = {lane: None for lane in LANES}
+        self._light_items = {
+            lane: (
+                c.create_oval(0, 0, 0, 0, fill=BG_DARK, outline=BORDER_DARK, width=1, tags='overlay'),
+                c.create_arc(0, 0, 0, 0, start=90, extent=0, style="arc", outline=ACCENT_TERTIARY, width=4,
+                             state='hidden', tags='overlay'),
+                c.create_oval(0, 0, 0, 0, outline=TEXT_PRIMARY, width=2, tags='overlay'),
+            )
+            for lane in LANES
+        }
+        self._layout_canvas()
+    
+    def _layout_canvas(self):
+        """Place all static main-canvas items for the current canvas size"""
+        c = self.canvas
+        w, h = self.canvas_width, self.canvas_height
+        cx, cy = w / 2, h / 2
+        rw = max(80, min(min(w, h) * 0.15, 150))
+        
+        road_v, road_h, intersection = self._road_items
+        c.coords(road_v, cx - rw / 2, 0, cx + rw / 2, h)
+        c.coords(road_h, 0, cy - rw / 2, w, cy + rw / 2)
+        c.coords(intersection, cx - rw / 2, cy - rw / 2, cx + rw / 2, cy + rw / 2)
+        
+        overflow = self._overflow_items
+        c.coords(overflow['N'], cx - 20, 0, cx + 20, 10)
+        c.coords(overflow['S'], cx - 20, h - 10, cx + 20, h)
+        c.coords(overflow['W'], 0, cy + 20, 10, cy - 20)
+        c.coords(overflow['E'], w - 10, cy + 20, w, cy - 20)
+        
+        # Queue labels sit beyond the road edge on their lane's side, lights at a corner
+        for lane in LANES:
+            sx, sy = self._QUEUE_SIDE[lane]
+            c.coords(self._queue_items[lane], cx + sx * (rw / 2 + 50), cy + sy * (rw / 2 + 50))
+            
+            sx, sy = self._LIGHT_CORNER[lane]
+            x, y = cx + sx * (rw / 2 + 25), cy + sy * (rw / 2 + 25)
+            housing, arc, lamp = self._light_items[lane]
+            c.coords(housing, x - 22, y - 22, x + 22, y + 22)
+            c.coords(arc, x - 20, y - 20, x + 20, y + 20)
+            c.coords(lamp, x - 12, y - 12, x + 12, y + 12)
+    
+    def _draw_cars(self, c):
+        """Move the pooled car rectangles onto the current cars"""
+        pool, fills = self._car_items, self._car_item_fills
+        coords, itemconfig = c.coords, c.itemconfig
+        get_color = Car.get_color
+        was_shown = self._car_items_shown
+        shown = 0
+        for car in self.all_cars():
+            if car.is_virtual:
+                continue
+            if shown == len(pool):
+                item = c.create_rectangle(0, 0, 0, 0, outline="black", state='hidden', tags='car')
+                c.tag_lower(item, 'overlay')
+                pool.append(item)
+                fills.append(None)
+            item = pool[shown]
+            x, y = car.x, car.y
+            coords(item, x - 6, y - 6, x + 6, y + 6)
+            
+            # Only restyle items whose colour changed or that were hidden last frame
+            color = get_color(car)
+            if shown >= was_shown:
+                fills[shown] = color
+                itemconfig(item, fill=color, state='normal')
+            elif color != fills[shown]:
+                fills[shown] = color
+                itemconfig(item, fill=color)
+            shown += 1
+        
+        # Hide spares that were visible last frame
+        for item in pool[shown:self._car_items_shown]:
+            itemconfig(item, state='hidden')
+        self._car_items_shown = shown
     
-    def _draw_light(self, c, lane, x, y):
+    def _draw_light(self, c, lane):
         """Draw a traffic light"""
         col = self.lights[lane]
         fill = LIGHT_GREEN if col == 'green' else (LIGHT_YELLOW if col == 'yellow' else LIGHT_RED)
         
-        c.create_oval(x - 22, y - 22, x + 22, y + 22, fill=BG_DARK, outline=BORDER_DARK, width=1)
+        _, arc, lamp = self._light_items[lane]
         
         if col == 'green' and lane == self.phase_order[self.current_phase_idx]:
             pct = min(1.0, self.state_timer / max(1, self.current_min_green))
-            c.create_arc(x - 20, y - 20, x + 20, y + 20, start=90, extent=-360 * pct, style="arc", outline=ACCENT_TERTIARY, width=4)
+            c.itemconfig(arc, extent=-360 * pct, state='normal')
+        else:
+            c.itemconfig(arc, state='hidden')
         
-        c.create_oval(x - 12, y - 12, x + 12, y + 12, fill=fill, outline=TEXT_PRIMARY, width=2)
+        c.itemconfig(lamp, fill=fill)
 
     # =========================================================================
     # ACTIONS
@@ -1174,7 +1460,7 @@ class UltimateTrafficApp(tk.Tk):
     
     def surge_traffic(self):
         """Add a surge of traffic to a random lane"""
-        self.virtual_queues[random.choice(['N', 'S', 'E', 'W'])] += 15
+        self.virtual_queues[random.choice(LANES)] += 15
 
 if __name__ == "__main__":
     app = UltimateTrafficApp()
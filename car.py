@@ -2,8 +2,6 @@
 # CAR.PY - Car Entity for Traffic Simulation
 # =============================================================================
 
-import math
-
 # Import theme colors
 try:
     from theme import CAR_NORMAL, CAR_WAITING, CAR_ANGRY
@@ -25,6 +23,14 @@ class Car:
         wait_time: Ticks spent waiting (used for patience calculation)
     """
     
+    # Fixed attribute layout: no per-car __dict__, faster attribute access
+    # in the per-frame physics loop and a smaller footprint per car
+    __slots__ = (
+        'lane', 'w', 'h', 'cx', 'cy', 'gap', 'stop_line_offset', 'is_virtual',
+        'length', 'width', 'speed', 'max_speed', 'accel', 'decel',
+        'wait_time', 'counted', 'x', 'y', 'dx', 'dy', 'stop_x', 'stop_y',
+    )
+    
     def __init__(self, lane, canvas_width, canvas_height):
         self.lane = lane
         self.w, self.h = canvas_width, canvas_height
@@ -88,28 +94,25 @@ class Car:
 
         target_speed = self.max_speed
         
-        # Calculate distance to stop line
-        dist_to_stop = 9999
-        if self.lane == 'N':
-            dist_to_stop = self.stop_y - self.y
-        elif self.lane == 'S':
-            dist_to_stop = self.y - self.stop_y
-        elif self.lane == 'W':
-            dist_to_stop = self.stop_x - self.x
-        elif self.lane == 'E':
-            dist_to_stop = self.x - self.stop_x
+        # Distance to stop line along the direction of travel (dx/dy is the sign)
+        if self.dy:
+            dist_to_stop = (self.stop_y - self.y) * self.dy
+        else:
+            dist_to_stop = (self.stop_x - self.x) * self.dx
         
         # Stop at red/yellow lights
-        if dist_to_stop > -10:
-            if light_color in ['red', 'yellow'] and dist_to_stop < 50:
-                target_speed = 0
+        if -10 < dist_to_stop < 50 and light_color != 'green':
+            target_speed = 0
         
         # Collision avoidance - balanced spacing
         if car_ahead and not car_ahead.is_virtual:
-            dist_to_car = math.sqrt((self.x - car_ahead.x) ** 2 + (self.y - car_ahead.y) ** 2)
-            if dist_to_car < 24:
+            # Compare squared distances (24px, 50px) to skip the sqrt
+            ddx = self.x - car_ahead.x
+            ddy = self.y - car_ahead.y
+            dist_sq = ddx * ddx + ddy * ddy
+            if dist_sq < 576:
                 target_speed = 0
-            elif dist_to_car < 50:
+            elif dist_sq < 2500:
                 target_speed = min(target_speed, car_ahead.speed)
         
         # Apply acceleration/deceleration
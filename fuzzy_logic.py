@@ -7,6 +7,8 @@
 # - Real-world traffic timing parameters (saturation headway ~2 sec/veh)
 # =============================================================================
 
+from functools import lru_cache
+
 import theme
 from theme import (
     MF_LOW, MF_MEDIUM, MF_HIGH,
@@ -21,6 +23,20 @@ from theme import (
     get_score_color
 )
 
+# Stand-in width for the vertical edge of a shoulder set (a == b or c == d),
+# so trapezoid slopes never divide by zero
+_FLAT_EDGE = 1e-9
+
+
+def _queue_factors(active_q):
+    """(R1 clearing boost, R3 batch boost, switch damping) for an active queue"""
+    active_queue_factor = min(1.0, active_q / 10.0)  # 0-1 based on queue size
+    return (
+        1 + active_queue_factor * 0.5,
+        1 + active_queue_factor * 0.3,
+        max(0.3, 1.0 - active_q / 25.0),  # Reduces to 0.3 at 25 cars
+    )
+
 
 class FuzzyLogicController:
     """
@@ -47,6 +63,17 @@ class FuzzyLogicController:
         - Score 0-100: Lower = SWITCH, Higher = KEEP
     """
     
+    # Derived inputs of the last calculate() call, kept for the visualization
+    __slots__ = ('_last_inputs',)
+    
+    def __init__(self):
+        self._last_inputs = (0.0, 0.0, 0.0)
+    
+    @property
+    def last_inputs(self):
+        """(clearance time, imbalance ratio, urgency index) of the last calculate()"""
+        return self._last_inputs
+    
     # -------------------------------------------------------------------------
     # TRAFFIC ENGINEERING PARAMETERS
     # -------------------------------------------------------------------------
@@ -57,6 +84,9 @@ class FuzzyLogicController:
     # Driver patience threshold (research shows ~30-60 sec before frustration)
     PATIENCE_THRESHOLD = 45.0  # seconds
     
+    # Simulation frame rate; wait times arrive as whole ticks / 60
+    WAIT_TICKS_PER_SEC = 60
+    
     # -------------------------------------------------------------------------
     # MEMBERSHIP FUNCTION DEFINITIONS (Based on Traffic Engineering)
     # -------------------------------------------------------------------------
@@ -65,24 +95,30 @@ class FuzzyLogicController:
     # Short: can clear quickly, consider switching if others waiting
     # Medium: moderate queue, standard timing
     # Long: big queue (15-25+ cars), needs extended green
-    CLEAR_SHORT = [0, 0, 6, 14]        # < 14 sec = small queue (< 7 cars)
-    CLEAR_MED = [10, 18, 30, 45]       # 18-30 sec = medium queue (9-15 cars)
-    CLEAR_LONG = [30, 45, 80, 80]      # > 45 sec = large queue (22+ cars)
+    CLEAR_SHORT = (0, 0, 6, 14)        # < 14 sec = small queue (< 7 cars)
+    CLEAR_MED = (10, 18, 30, 45)       # 18-30 sec = medium queue (9-15 cars)
+    CLEAR_LONG = (30, 45, 80, 80)      # > 45 sec = large queue (22+ cars)
     
     # Queue Imbalance Ratio Sets (waiting/active)
     # Low: fair service, active lane is busy
     # Medium: moderate imbalance
     # High: waiting lanes are being neglected (but only trigger switch for small active queues)
-    IMBAL_LOW = [0, 0, 0.8, 2.0]       # Active queue is larger or equal
-    IMBAL_MED = [1.5, 2.5, 4.0, 6.0]   # 2.5-4x more waiting
-    IMBAL_HIGH = [4.0, 6.0, 15, 15]    # 6x+ more waiting = unfair (high bar)
+    IMBAL_LOW = (0, 0, 0.8, 2.0)       # Active queue is larger or equal
+    IMBAL_MED = (1.5, 2.5, 4.0, 6.0)   # 2.5-4x more waiting
+    IMBAL_HIGH = (4.0, 6.0, 15, 15)    # 6x+ more waiting = unfair (high bar)
     
     # Urgency Index Sets (pressure from waiting drivers)
     # Based on patience studies: frustration starts at ~30-60 sec
     # Raised thresholds to allow large batches to clear
-    URG_LOW = [0, 0, 0.4, 1.0]         # Patient drivers
-    URG_MED = [0.7, 1.2, 1.8, 2.5]     # Getting impatient
-    URG_HIGH = [1.8, 2.5, 6.0, 6.0]    # Frustrated, urgent switch needed
+    URG_LOW = (0, 0, 0.4, 1.0)         # Patient drivers
+    URG_MED = (0.7, 1.2, 1.8, 2.5)     # Getting impatient
+    URG_HIGH = (1.8, 2.5, 6.0, 6.0)    # Frustrated, urgent switch needed
+    
+    # (low, med, high) groups, fuzzified together per input
+    CLEAR_SETS = (CLEAR_SHORT, CLEAR_MED, CLEAR_LONG)
+    IMBAL_SETS = (IMBAL_LOW, IMBAL_MED, IMBAL_HIGH)
+    URG_SETS = (URG_LOW, URG_MED, URG_HIGH)
+    ALL_SETS = CLEAR_SETS + IMBAL_SETS + URG_SETS
     
     # Rule Weights - Tuned for realistic driving behavior and large batches
     RULE_WEIGHTS = {
@@ -96,6 +132,15 @@ class FuzzyLogicController:
         'balance': 0.8
     }
     
+    # Weights in the order calculate() unpacks them, so the hot path does
+    # no per-tick dict lookups
+    _WEIGHT_ORDER = (
+        'keep_clearing', 'keep_efficient', 'keep_batch',
+        'switch_imbalance', 'switch_urgent', 'switch_empty',
+        'conflict', 'balance',
+    )
+    _WEIGHTS = tuple(map(RULE_WEIGHTS.__getitem__, _WEIGHT_ORDER))
+    
     # Output Centroids
     OUT_SWITCH_CENTROID = 15
     OUT_BALANCE_CENTROID = 50
@@ -109,41 +154,42 @@ class FuzzyLogicController:
     def trapmf(x, abcd):
         """Trapezoidal membership function"""
         a, b, c, d = abcd
-        if x <= a or x >= d:
-            return 0.0
-        if b <= x <= c:
-            return 1.0
-        if a < x < b:
-            return (x - a) / (b - a)
-        if c < x < d:
-            return (d - x) / (d - c)
-        return 0.0
+        return max(0.0, min((x - a) / ((b - a) or _FLAT_EDGE), 1.0, (d - x) / ((d - c) or _FLAT_EDGE)))
+    
+    @staticmethod
+    def fuzzify3(x, sets):
+        """Membership of x in all three (low, med, high) sets in one call"""
+        return [max(0.0, min((x - a) / ((b - a) or _FLAT_EDGE), 1.0, (d - x) / ((d - c) or _FLAT_EDGE)))
+                for a, b, c, d in sets]
     
     # -------------------------------------------------------------------------
     # DERIVED INPUT CALCULATIONS (Traffic Engineering)
     # -------------------------------------------------------------------------
     
-    def calc_clearance_time(self, queue_length):
+    @classmethod
+    def calc_clearance_time(cls, queue_length):
         """
         Estimate time (seconds) to clear a queue at saturation flow.
         Based on typical headway of 2 seconds between vehicles.
         """
-        return queue_length * self.SATURATION_HEADWAY
+        return queue_length * cls.SATURATION_HEADWAY
     
-    def calc_imbalance_ratio(self, active_q, max_waiting_q):
+    @staticmethod
+    def calc_imbalance_ratio(active_q, max_waiting_q):
         """
         Calculate how imbalanced the traffic distribution is.
         High ratio = waiting lanes being neglected (unfair).
         """
         return max_waiting_q / (active_q + 1)  # +1 to avoid division by zero
     
-    def calc_urgency_index(self, max_wait_time, max_waiting_q):
+    @classmethod
+    def calc_urgency_index(cls, max_wait_time, max_waiting_q):
         """
         Calculate urgency based on wait time and queue size.
         Combines driver frustration (time) with traffic pressure (queue).
         Research shows frustration starts at ~30-60 seconds.
         """
-        time_factor = max_wait_time / self.PATIENCE_THRESHOLD
+        time_factor = max_wait_time / cls.PATIENCE_THRESHOLD
         queue_factor = 1 + max_waiting_q / 10.0
         return time_factor * queue_factor
     
@@ -164,79 +210,105 @@ class FuzzyLogicController:
         Returns:
             tuple: (score, mu_clear, mu_imbal, mu_urg, mu_flow, rules, sets)
         """
+        # Queues are whole cars and the app measures waits in whole 60 fps
+        # ticks (max_wait_time = ticks / 60), so keying on the tick count is
+        # lossless and the result repeats across frames. flow_ratio is
+        # display-only and not part of the key
+        derived, result = self._evaluate(active_q, max_waiting_q, round(max_wait_time * self.WAIT_TICKS_PER_SEC))
+        
+        # Store derived inputs for display
+        self._last_inputs = derived
+        return result
+    
+    @classmethod
+    def clear_cache(cls):
+        """Rebuild the derived tables and drop memoized results
+        
+        Call after tuning any class-level parameter (RULE_WEIGHTS, the
+        membership sets, the headway or patience threshold).
+        """
+        cls.CLEAR_SETS = (cls.CLEAR_SHORT, cls.CLEAR_MED, cls.CLEAR_LONG)
+        cls.IMBAL_SETS = (cls.IMBAL_LOW, cls.IMBAL_MED, cls.IMBAL_HIGH)
+        cls.URG_SETS = (cls.URG_LOW, cls.URG_MED, cls.URG_HIGH)
+        cls.ALL_SETS = cls.CLEAR_SETS + cls.IMBAL_SETS + cls.URG_SETS
+        cls._WEIGHTS = tuple(map(cls.RULE_WEIGHTS.__getitem__, cls._WEIGHT_ORDER))
+        cls._evaluate.cache_clear()
+    
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _evaluate(cls, active_q, max_waiting_q, wait_ticks):
+        """Memoized body of calculate(); returns ((derived inputs), result)"""
         # DERIVE REALISTIC INPUTS
-        clearance_time = self.calc_clearance_time(active_q)
-        imbalance_ratio = self.calc_imbalance_ratio(active_q, max_waiting_q)
-        urgency_index = self.calc_urgency_index(max_wait_time, max_waiting_q)
+        # (runs once per distinct key, so the helper calls cost nothing per tick)
+        clearance_time = cls.calc_clearance_time(active_q)
+        imbalance_ratio = cls.calc_imbalance_ratio(active_q, max_waiting_q)
+        urgency_index = cls.calc_urgency_index(wait_ticks / cls.WAIT_TICKS_PER_SEC, max_waiting_q)
         
         # 1. FUZZIFICATION
         
+        fuzzify3 = cls.fuzzify3
+        
         # Clearance Time memberships
-        mu_clear_short = self.trapmf(clearance_time, self.CLEAR_SHORT)
-        mu_clear_med = self.trapmf(clearance_time, self.CLEAR_MED)
-        mu_clear_long = self.trapmf(clearance_time, self.CLEAR_LONG)
+        mu_clear_short, mu_clear_med, mu_clear_long = fuzzify3(clearance_time, cls.CLEAR_SETS)
         
         # Imbalance Ratio memberships
-        mu_imbal_low = self.trapmf(imbalance_ratio, self.IMBAL_LOW)
-        mu_imbal_med = self.trapmf(imbalance_ratio, self.IMBAL_MED)
-        mu_imbal_high = self.trapmf(imbalance_ratio, self.IMBAL_HIGH)
+        mu_imbal_low, mu_imbal_med, mu_imbal_high = fuzzify3(imbalance_ratio, cls.IMBAL_SETS)
         
         # Urgency Index memberships
-        mu_urg_low = self.trapmf(urgency_index, self.URG_LOW)
-        mu_urg_med = self.trapmf(urgency_index, self.URG_MED)
-        mu_urg_high = self.trapmf(urgency_index, self.URG_HIGH)
+        mu_urg_low, mu_urg_med, mu_urg_high = fuzzify3(urgency_index, cls.URG_SETS)
         
         # 2. RULE EVALUATION
-        w = self.RULE_WEIGHTS
+        (w_keep_clearing, w_keep_efficient, w_keep_batch,
+         w_switch_imbalance, w_switch_urgent, w_switch_empty,
+         w_conflict, w_balance) = cls._WEIGHTS
         
         # KEEP RULES - Reasons to keep the current green light
         
         # R1: Keep clearing a long queue (significant work to do)
         # Stronger effect when active queue is large
-        active_queue_factor = min(1.0, active_q / 10.0)  # 0-1 based on queue size
-        r1_clearing = min(mu_clear_long, 1 - mu_urg_high) * w['keep_clearing'] * (1 + active_queue_factor * 0.5)
+        aqf_clearing, aqf_batch, switch_damping = _queue_factors(active_q)
+        r1_clearing = min(mu_clear_long, 1 - mu_urg_high) * w_keep_clearing * aqf_clearing
         
         # R2: Keep when balanced (low imbalance, medium clearance)
-        r1_efficient = min(mu_imbal_low, mu_clear_med, 1 - mu_urg_high) * w['keep_efficient']
+        r1_efficient = min(mu_imbal_low, mu_clear_med, 1 - mu_urg_high) * w_keep_efficient
         
         # R3: Keep to let current batch through (medium/long queue, low urgency)
         # Extended to include both medium and long clearance
-        r1_batch = min(max(mu_clear_med, mu_clear_long), mu_imbal_low, mu_urg_low) * w['keep_batch'] * (1 + active_queue_factor * 0.3)
+        r1_batch = min(max(mu_clear_med, mu_clear_long), mu_imbal_low, mu_urg_low) * w_keep_batch * aqf_batch
         
         r1_total = max(r1_clearing, r1_efficient, r1_batch)
         
         # SWITCH RULES - Reasons to switch to another lane
-        # All switch rules are weakened when active queue is large
-        switch_damping = max(0.3, 1.0 - active_q / 25.0)  # Reduces to 0.3 at 25 cars
+        # All switch rules are weakened when active queue is large (switch_damping)
         
         # R4: Switch when high imbalance (waiting lanes neglected)
-        r2_imbalance = min(mu_imbal_high, max(mu_clear_short, mu_clear_med)) * w['switch_imbalance'] * switch_damping
+        r2_imbalance = min(mu_imbal_high, max(mu_clear_short, mu_clear_med)) * w_switch_imbalance * switch_damping
         
         # R5: Switch when urgency is high (frustrated drivers)
-        r2_urgent = mu_urg_high * w['switch_urgent'] * switch_damping
+        r2_urgent = mu_urg_high * w_switch_urgent * switch_damping
         
         # R6: Switch when active lane nearly empty and others waiting
-        r2_empty = min(mu_clear_short, max(mu_imbal_med, mu_imbal_high)) * w['switch_empty']
+        r2_empty = min(mu_clear_short, max(mu_imbal_med, mu_imbal_high)) * w_switch_empty
         
         # R7: Switch for moderate imbalance + moderate urgency
-        r2_combined = min(mu_imbal_med, mu_urg_med) * w['balance'] * switch_damping
+        r2_combined = min(mu_imbal_med, mu_urg_med) * w_balance * switch_damping
         
         r2_total = max(r2_imbalance, r2_urgent, r2_empty, r2_combined)
         
         # CONFLICT RULES - Both sides have strong needs
         
         # R8: Conflict - long clearance AND high urgency from waiting
-        r3_conflict = min(mu_clear_long, mu_urg_high) * w['conflict']
+        r3_conflict = min(mu_clear_long, mu_urg_high) * w_conflict
         
         # R9: Balanced conflict - medium everything
-        r3_balanced = min(mu_clear_med, mu_imbal_med, mu_urg_med) * w['balance']
+        r3_balanced = min(mu_clear_med, mu_imbal_med, mu_urg_med) * w_balance
         
         r3_total = max(r3_conflict, r3_balanced)
         
         # 3. DEFUZZIFICATION - Weighted average
-        num = (r1_total * self.OUT_KEEP_CENTROID + 
-               r2_total * self.OUT_SWITCH_CENTROID + 
-               r3_total * self.OUT_BALANCE_CENTROID)
+        num = (r1_total * cls.OUT_KEEP_CENTROID + 
+               r2_total * cls.OUT_SWITCH_CENTROID + 
+               r3_total * cls.OUT_BALANCE_CENTROID)
         den = r1_total + r2_total + r3_total + 0.001
         score = num / den
         
@@ -265,25 +337,16 @@ class FuzzyLogicController:
         score = max(0, min(100, score + batch_bonus + empty_penalty + urgency_penalty))
         
         # 5. RETURN DATA for visualization
-        # Store derived inputs for display
-        self._last_inputs = {
-            'clearance_time': clearance_time,
-            'imbalance_ratio': imbalance_ratio,
-            'urgency_index': urgency_index
-        }
-
         # pack the rules return
 
-        return (
+        return (clearance_time, imbalance_ratio, urgency_index), (
             score,
             (mu_clear_short, mu_clear_med, mu_clear_long),
             (mu_imbal_low, mu_imbal_med, mu_imbal_high),
             (mu_urg_low, mu_urg_med, mu_urg_high),
             (0, 0, 0),  # Placeholder for 4th input (not used)
             (r1_clearing, r1_efficient,r1_batch, r2_imbalance, r2_empty, r2_urgent, r3_balanced,r3_conflict, r3_total,r1_total),
-            (self.CLEAR_SHORT, self.CLEAR_MED, self.CLEAR_LONG,
-             self.IMBAL_LOW, self.IMBAL_MED, self.IMBAL_HIGH,
-             self.URG_LOW, self.URG_MED, self.URG_HIGH)
+            cls.ALL_SETS
         )
 
 
@@ -292,10 +355,88 @@ class FuzzyLogicController:
 # =============================================================================
 
 class FuzzyVisualizer:
-    """Handles all fuzzy logic visualization on canvas widgets"""
+    """Handles all fuzzy logic visualization on canvas widgets
+    
+    Each canvas gets its items created on first draw; later draws move and
+    restyle them with coords/itemconfig instead of deleting and recreating
+    everything. Per-canvas state (items, size, last draw key and layout) is
+    kept in self._canvases, keyed by canvas.
+    """
+    
+    def __init__(self, on_resize=None):
+        """
+        Args:
+            on_resize: Optional callback run when a drawn canvas changes size,
+                so the owner can schedule a redraw
+        """
+        self._canvases = {}
+        self._on_resize = on_resize
+    
+    def _state(self, cv):
+        """Per-canvas state dict, created (and <Configure> bound) on first use"""
+        state = self._canvases.get(cv)
+        if state is None:
+            state = self._canvases[cv] = {
+                'items': None,
+                'size': (cv.winfo_width(), cv.winfo_height()),
+                'draw_key': None,
+                'layout': None,
+            }
+            cv.bind('<Configure>', lambda e: self._resized(state, e.width, e.height), add='+')
+            # Rebuilding the sidebar destroys the canvases; forget them with it
+            cv.bind('<Destroy>', lambda e: self._canvases.pop(cv, None), add='+')
+        return state
+    
+    def _resized(self, state, w, h):
+        """Track the new canvas size and force the next draw to run"""
+        if state['size'] == (w, h):
+            return
+        state['size'] = (w, h)
+        state['draw_key'] = None
+        if self._on_resize is not None:
+            self._on_resize()
+    
+    def _unchanged(self, cv, key):
+        """True if cv was last drawn from key; otherwise remember key for next time"""
+        state = self._state(cv)
+        if state['draw_key'] == key:
+            return True
+        state['draw_key'] = key
+        return False
+    
+    def _size(self, cv):
+        """Canvas (width, height), tracked from <Configure> after the first Tk query"""
+        return self._state(cv)['size']
+    
+    def _items(self, cv, create):
+        """Return the canvas items for cv, creating them with create(cv) on first use"""
+        state = self._state(cv)
+        if state['items'] is None:
+            state['items'] = create(cv)
+        return state['items']
     
     @staticmethod
-    def draw_membership_3(cv, title, val, mus, sets_low, sets_med, sets_high, max_range):
+    def _create_membership_items(cv):
+        """Create the membership graph's canvas items once"""
+        mini = theme.get_font(theme.FONT_MINI)
+        micro = theme.get_font(theme.FONT_MICRO)
+        return {
+            'title': cv.create_text(0, 0, fill=TEXT_PRIMARY, font=theme.get_font(theme.FONT_TINY)),
+            'axis': cv.create_line(0, 0, 0, 0, fill=BORDER_DARK),
+            'axis_min': cv.create_text(0, 0, text="0", fill=TEXT_MUTED, font=mini, anchor='n'),
+            'axis_max': cv.create_text(0, 0, fill=TEXT_MUTED, font=mini, anchor='n'),
+            'polys': [
+                cv.create_polygon(0, 0, 0, 0, 0, 0, 0, 0, outline=col, fill="", width=2)
+                for col in (MF_LOW, MF_MEDIUM, MF_HIGH)
+            ],
+            'mu_low': cv.create_text(0, 0, fill=MF_LOW, font=micro, anchor='w'),
+            'mu_med': cv.create_text(0, 0, fill=MF_MEDIUM, font=micro, anchor='center'),
+            'mu_high': cv.create_text(0, 0, fill=MF_HIGH, font=micro, anchor='e'),
+            'val_line': cv.create_line(0, 0, 0, 0, fill=TEXT_PRIMARY, width=2),
+            'val_text': cv.create_text(0, 0, fill=ACCENT_PRIMARY, font=mini),
+        }
+    
+    def draw_membership_3(self, cv, title, val, mus, sets_low, sets_med, sets_high, max_range):
         """
         Draw membership function with 3 sets (Low/Med/High)
         
@@ -307,57 +448,66 @@ class FuzzyVisualizer:
             sets_low, sets_med, sets_high: Trapezoidal set definitions [a,b,c,d]
             max_range: X-axis maximum value
         """
-        cv.delete("all")
-        
         # Get canvas dimensions
-        w = cv.winfo_width()
-        h = cv.winfo_height()
+        w, h = self._size(cv)
         if w < 50:
             w = 160
         if h < 50:
             h = 120
         
+        mu_low, mu_med, mu_high = mus
+        key = (w, h, title, round(val, 3), round(mu_low, 3), round(mu_med, 3), round(mu_high, 3), max_range)
+        if self._unchanged(cv, key):
+            return
+        items = self._items(cv, self._create_membership_items)
+        coords, itemconfig = cv.coords, cv.itemconfig
+        
         pad = 15
         gw, gh = w - 2 * pad, h - 2 * pad - 15
         ox, oy = pad, h - pad - 10
-        
-        # Title
-        cv.create_text(w / 2, 8, text=title, fill=TEXT_PRIMARY, font=theme.FONT_TINY)
-        
-        # Axis
-        cv.create_line(ox, oy, ox + gw, oy, fill=BORDER_DARK)
-        
-        # Format axis labels based on range
-        if max_range <= 2:
-            cv.create_text(ox, oy + 10, text="0", fill=TEXT_MUTED, font=theme.FONT_MINI, anchor='n')
-            cv.create_text(ox + gw, oy + 10, text=f"{max_range:.1f}", fill=TEXT_MUTED, font=theme.FONT_MINI, anchor='n')
-        else:
-            cv.create_text(ox, oy + 10, text="0", fill=TEXT_MUTED, font=theme.FONT_MINI, anchor='n')
-            cv.create_text(ox + gw, oy + 10, text=f"{int(max_range)}+", fill=TEXT_MUTED, font=theme.FONT_MINI, anchor='n')
-        
         scale_x = gw / max_range
         
-        def draw_poly(abcd, col):
-            a, b, c_pt, d = abcd
+        # Title, axis and set polygons only depend on the size and the set
+        # definitions, so they are only laid out again when those change
+        layout = (w, h, title, max_range, sets_low, sets_med, sets_high)
+        state = self._state(cv)
+        if state['layout'] != layout:
+            state['layout'] = layout
+            
+            # Title
+            coords(items['title'], w / 2, 8)
+            itemconfig(items['title'], text=title)
+            
+            # Axis
+            coords(items['axis'], ox, oy, ox + gw, oy)
+            
+            # Format axis labels based on range
+            coords(items['axis_min'], ox, oy + 10)
+            coords(items['axis_max'], ox + gw, oy + 10)
+            if max_range <= 2:
+                itemconfig(items['axis_max'], text=f"{max_range:.1f}")
+            else:
+                itemconfig(items['axis_max'], text=f"{int(max_range)}+")
+            
             def cx(v):
                 return ox + min(v * scale_x, gw)
-            pts = [cx(a), oy, cx(b), oy - gh, cx(c_pt), oy - gh, cx(d), oy]
-            cv.create_polygon(pts, outline=col, fill="", width=2)
-        
-        # Draw membership functions
-        draw_poly(sets_low, MF_LOW)
-        draw_poly(sets_med, MF_MEDIUM)
-        draw_poly(sets_high, MF_HIGH)
+            
+            # Membership functions
+            for poly, (a, b, c_pt, d) in zip(items['polys'], (sets_low, sets_med, sets_high)):
+                coords(poly, cx(a), oy, cx(b), oy - gh, cx(c_pt), oy - gh, cx(d), oy)
+            
+            coords(items['mu_low'], ox + 5, 20)
+            coords(items['mu_med'], w / 2, 20)
+            coords(items['mu_high'], w - pad - 5, 20)
         
         # Membership values display
-        mu_low, mu_med, mu_high = mus
-        cv.create_text(ox + 5, 20, text=f"S:{mu_low:.1f}", fill=MF_LOW, font=theme.FONT_MICRO, anchor='w')
-        cv.create_text(w / 2, 20, text=f"M:{mu_med:.1f}", fill=MF_MEDIUM, font=theme.FONT_MICRO, anchor='center')
-        cv.create_text(w - pad - 5, 20, text=f"H:{mu_high:.1f}", fill=MF_HIGH, font=theme.FONT_MICRO, anchor='e')
+        itemconfig(items['mu_low'], text=f"S:{mu_low:.1f}")
+        itemconfig(items['mu_med'], text=f"M:{mu_med:.1f}")
+        itemconfig(items['mu_high'], text=f"H:{mu_high:.1f}")
         
         # Current value indicator
         ix = ox + min(val * scale_x, gw)
-        cv.create_line(ix, oy, ix, oy - gh, fill=TEXT_PRIMARY, width=2)
+        coords(items['val_line'], ix, oy, ix, oy - gh)
         
         # Format value display
         if max_range <= 2:
@@ -366,10 +516,33 @@ class FuzzyVisualizer:
             val_text = f"{val:.1f}"
         else:
             val_text = f"{val:.0f}s"
-        cv.create_text(ix, oy - gh - 5, text=val_text, fill=ACCENT_PRIMARY, font=theme.FONT_MINI)
+        coords(items['val_text'], ix, oy - gh - 5)
+        itemconfig(items['val_text'], text=val_text)
+    
+    # (label, index into draw_rules_expanded's rules, color, weight text) per bar
+    _RULE_BARS = (
+        ("KEEP Clear", 0, RULE_KEEP, "w:1.4"),
+        ("Batch", 5, RULE_KEEP_ALT, "w:1.3"),
+        ("Imbalance", 1, RULE_SWITCH, "w:1.3"),
+        ("Urgency", 2, RULE_SWITCH_TIME, "w:1.5"),
+        ("Empty", 4, RULE_SWITCH_EMPTY, "w:1.6"),
+        ("CONFLICT", 3, RULE_CONFLICT, "w:0.7"),
+    )
     
     @staticmethod
-    def draw_rules_expanded(cv, rules, flow_ratio, mu_f):
+    def _create_rule_items(cv):
+        """Create one (label, track, fill, value, weight) item row per rule bar"""
+        small, tiny = theme.get_font(theme.FONT_SMALL), theme.get_font(theme.FONT_TINY)
+        return [
+            (cv.create_text(0, 0, text=txt, fill=TEXT_PRIMARY, anchor='e', font=small),
+             cv.create_rectangle(0, 0, 0, 0, fill=BG_DARK, outline=""),
+             cv.create_rectangle(0, 0, 0, 0, fill=col, outline=""),
+             cv.create_text(0, 0, fill=TEXT_MUTED, anchor='w', font=tiny),
+             cv.create_text(0, 0, text=weight, fill=TEXT_DISABLED, anchor='w', font=tiny))
+            for txt, _, col, weight in FuzzyVisualizer._RULE_BARS
+        ]
+    
+    def draw_rules_expanded(self, cv, rules, flow_ratio, mu_f):
         """
         Draw expanded rule visualization with traffic engineering labels
         
@@ -379,18 +552,18 @@ class FuzzyVisualizer:
             flow_ratio: Current flow ratio
             mu_f: Flow membership values tuple (unused but kept for interface)
         """
-        r1_total, r2_imbalance, r2_urgent, r3_total, r2_empty, r1_batch = rules
-        
-        cv.delete("all")
-        
         # Get canvas dimensions
-        w = cv.winfo_width()
-        h = cv.winfo_height()
+        w, h = self._size(cv)
         if w < 100:
             w = 495
         if h < 50:
             h = 130
         
+        if self._unchanged(cv, (w, h, tuple(round(v, 3) for v in rules))):
+            return
+        rows = self._items(cv, self._create_rule_items)
+        coords, itemconfig = cv.coords, cv.itemconfig
+        
         # Responsive layout
         label_width = min(120, w * 0.24)
         bar_start = label_width + 8
@@ -399,29 +572,31 @@ class FuzzyVisualizer:
         bar_height = 14
         row_spacing = 20
         
-        def bar(y, txt, v, col, weight=""):
-            cv.create_text(label_width, y + bar_height / 2, text=txt, fill=TEXT_PRIMARY, anchor='e', font=theme.FONT_SMALL)
-            cv.create_rectangle(bar_start, y, bar_start + bar_width, y + bar_height, fill=BG_DARK, outline="")
-            bw = bar_width * min(v, 2.0) / 2.0
-            cv.create_rectangle(bar_start, y, bar_start + bw, y + bar_height, fill=col, outline="")
-            cv.create_text(bar_start + bar_width + 8, y + bar_height / 2, text=f"{v:.2f}", fill=TEXT_MUTED, anchor='w', font=theme.FONT_TINY)
-            if weight:
-                cv.create_text(bar_start + bar_width + 45, y + bar_height / 2, text=weight, fill=TEXT_DISABLED, anchor='w', font=theme.FONT_TINY)
-        
-        # KEEP rules (green shades) - reasons to keep green
-        bar(4, "KEEP Clear", r1_total, RULE_KEEP, "w:1.4")
-        bar(4 + row_spacing, "Batch", r1_batch, RULE_KEEP_ALT, "w:1.3")
-        
-        # SWITCH rules (red shades) - reasons to switch
-        bar(4 + row_spacing * 2, "Imbalance", r2_imbalance, RULE_SWITCH, "w:1.3")
-        bar(4 + row_spacing * 3, "Urgency", r2_urgent, RULE_SWITCH_TIME, "w:1.5")
-        bar(4 + row_spacing * 4, "Empty", r2_empty, RULE_SWITCH_EMPTY, "w:1.6")
-        
-        # CONFLICT rule (orange) - tough decisions
-        bar(4 + row_spacing * 5, "CONFLICT", r3_total, RULE_CONFLICT, "w:0.7")
+        # KEEP rules (green shades), SWITCH rules (red shades), CONFLICT (orange)
+        for row, ((label, track, fill, value, weight), (_, idx, _, _)) in enumerate(zip(rows, self._RULE_BARS)):
+            v = rules[idx]
+            y = 4 + row_spacing * row
+            mid = y + bar_height / 2
+            coords(label, label_width, mid)
+            coords(track, bar_start, y, bar_start + bar_width, y + bar_height)
+            coords(fill, bar_start, y, bar_start + bar_width * min(v, 2.0) / 2.0, y + bar_height)
+            coords(value, bar_start + bar_width + 8, mid)
+            itemconfig(value, text=f"{v:.2f}")
+            coords(weight, bar_start + bar_width + 45, mid)
     
     @staticmethod
-    def draw_flow_indicator(cv, flow_ratio, mu_f):
+    def _create_flow_items(cv):
+        """Create the flow indicator's canvas items once"""
+        return {
+            'label': cv.create_text(0, 0, text="FLOW:", fill=FLOW_PRIMARY, font=theme.get_font(theme.FONT_LABEL_BOLD), anchor='w'),
+            'value': cv.create_text(0, 0, fill=FLOW_PRIMARY, font=theme.get_font(theme.FONT_VALUE_MEDIUM), anchor='w'),
+            'track': cv.create_rectangle(0, 0, 0, 0, fill=BG_DARK, outline=BORDER_DARK),
+            'fill': cv.create_rectangle(0, 0, 0, 0, outline=""),
+            'target': cv.create_line(0, 0, 0, 0, fill=TEXT_MUTED, width=1),
+            'status': cv.create_text(0, 0, font=theme.get_font(theme.FONT_STATUS), anchor='e'),
+        }
+    
+    def draw_flow_indicator(self, cv, flow_ratio, mu_f):
         """
         Draw flow indicator showing throughput status
         
@@ -430,16 +605,20 @@ class FuzzyVisualizer:
             flow_ratio: Current flow ratio
             mu_f: Flow membership values (unused, kept for interface compatibility)
         """
-        cv.delete("all")
-        
-        w = cv.winfo_width()
+        w = self._size(cv)[0]
         if w < 100:
             w = 400
         h = 35
         
+        if self._unchanged(cv, (w, round(flow_ratio, 3))):
+            return
+        items = self._items(cv, self._create_flow_items)
+        coords, itemconfig = cv.coords, cv.itemconfig
+        
         # Flow label and value
-        cv.create_text(10, h / 2, text="FLOW:", fill=FLOW_PRIMARY, font=theme.FONT_LABEL_BOLD, anchor='w')
-        cv.create_text(55, h / 2, text=f"{flow_ratio:.2f}x", fill=FLOW_PRIMARY, font=theme.FONT_VALUE_MEDIUM, anchor='w')
+        coords(items['label'], 10, h / 2)
+        coords(items['value'], 55, h / 2)
+        itemconfig(items['value'], text=f"{flow_ratio:.2f}x")
         
         # Simple progress bar showing flow ratio
         bar_x = 120
@@ -447,7 +626,7 @@ class FuzzyVisualizer:
         bar_h = 16
         bar_y = (h - bar_h) / 2
         
-        cv.create_rectangle(bar_x, bar_y, bar_x + bar_w, bar_y + bar_h, fill=BG_DARK, outline=BORDER_DARK)
+        coords(items['track'], bar_x, bar_y, bar_x + bar_w, bar_y + bar_h)
         
         # Fill based on flow ratio (1.0 = full)
         fill_w = min(bar_w, bar_w * flow_ratio)
@@ -457,11 +636,12 @@ class FuzzyVisualizer:
             fill_color = FLOW_HIGH
         else:
             fill_color = FLOW_MED
-        cv.create_rectangle(bar_x, bar_y, bar_x + fill_w, bar_y + bar_h, fill=fill_color, outline="")
+        coords(items['fill'], bar_x, bar_y, bar_x + fill_w, bar_y + bar_h)
+        itemconfig(items['fill'], fill=fill_color)
         
         # Target line at 1.0
         target_x = bar_x + bar_w
-        cv.create_line(target_x, bar_y - 2, target_x, bar_y + bar_h + 2, fill=TEXT_MUTED, width=1)
+        coords(items['target'], target_x, bar_y - 2, target_x, bar_y + bar_h + 2)
         
         # Status text
         if flow_ratio < 0.7:
@@ -470,10 +650,39 @@ class FuzzyVisualizer:
             status, status_color = "EXCEEDING", FLOW_HIGH
         else:
             status, status_color = "ON TARGET", FLOW_MED
-        cv.create_text(w - 10, h / 2, text=status, fill=status_color, font=theme.FONT_STATUS, anchor='e')
+        coords(items['status'], w - 10, h / 2)
+        itemconfig(items['status'], text=status, fill=status_color)
     
     @staticmethod
-    def draw_output_expanded(cv, score, rules, threshold):
+    def _create_output_items(cv):
+        """Create the decision output's canvas items once"""
+        tiny = theme.get_font(theme.FONT_TINY)
+        return {
+            'axis': cv.create_line(0, 0, 0, 0, fill=TEXT_DISABLED),
+            'axis_switch': cv.create_text(0, 0, text="SWITCH", fill=STATUS_ERROR, font=tiny, anchor="w"),
+            'axis_hold': cv.create_text(0, 0, text="HOLD", fill=STATUS_WARNING, font=tiny, anchor="center"),
+            'axis_keep': cv.create_text(0, 0, text="KEEP", fill=STATUS_GOOD, font=tiny, anchor="e"),
+            'regions': [cv.create_polygon(0, 0, 0, 0, 0, 0, outline=BG_DARK, fill="") for _ in range(3)],
+            'fills': [
+                cv.create_polygon(0, 0, 0, 0, 0, 0, fill=col, outline="", state='hidden')
+                for col in FuzzyVisualizer._OUTPUT_COLORS
+            ],
+            'threshold_line': cv.create_line(0, 0, 0, 0, fill=ACCENT_PRIMARY, width=1, dash=(3, 3)),
+            'threshold_text': cv.create_text(0, 0, fill=ACCENT_PRIMARY, font=theme.get_font(theme.FONT_MINI)),
+            'score_line': cv.create_line(0, 0, 0, 0, fill=TEXT_PRIMARY, width=3),
+            'score_text': cv.create_text(0, 0, font=theme.get_font(theme.FONT_SCORE)),
+            'decision': cv.create_text(0, 0, font=theme.get_font(theme.FONT_LABEL_BOLD)),
+        }
+    
+    # (left, peak, right) score positions of the SWITCH / HOLD / KEEP output sets
+    _OUTPUT_SETS = ((0, 15, 35), (25, 50, 75), (65, 85, 100))
+    _OUTPUT_COLORS = (OUT_SWITCH, OUT_HOLD, OUT_KEEP)
+    
+    # Decision indicator (text, fill) below / at-or-above the threshold
+    _DECISION_SWITCH = ("→ SWITCH", STATUS_ERROR)
+    _DECISION_KEEP = ("→ KEEP", STATUS_GOOD)
+    
+    def draw_output_expanded(self, cv, score, rules, threshold):
         """
         Draw output with dynamic threshold indicator
         
@@ -486,64 +695,70 @@ class FuzzyVisualizer:
         r1_clearing, r1_efficient, r1_batch, r2_imbalance, r2_empty, r2_urgent, r3_balance, r3_conflict, r3_total, r1_total = rules
         r2_total = max(r2_imbalance, r2_urgent, r2_empty)
         
-        cv.delete("all")
-        
         # Get canvas dimensions
-        w = cv.winfo_width()
-        h = cv.winfo_height()
+        w, h = self._size(cv)
         if w < 100:
             w = 495
         if h < 50:
             h = 80
         
+        key = (w, h, round(score, 1), round(r1_total, 3), round(r2_total, 3), round(r3_total, 3), threshold)
+        if self._unchanged(cv, key):
+            return
+        items = self._items(cv, self._create_output_items)
+        coords, itemconfig = cv.coords, cv.itemconfig
+        
         pad = 20
         gw, gh = w - 2 * pad, h - 2 * pad
         ox, oy = pad, h - pad
         
-        # Axis
-        cv.create_line(ox, oy, ox + gw, oy, fill=TEXT_DISABLED)
-        cv.create_text(ox, oy + 10, text="SWITCH", fill=STATUS_ERROR, font=theme.FONT_TINY, anchor="w")
-        cv.create_text(ox + gw / 2, oy + 10, text="HOLD", fill=STATUS_WARNING, font=theme.FONT_TINY, anchor="center")
-        cv.create_text(ox + gw, oy + 10, text="KEEP", fill=STATUS_GOOD, font=theme.FONT_TINY, anchor="e")
-        
         def to_x(v):
             return ox + (v / 100 * gw)
         
-        # Output membership regions
-        cv.create_polygon(to_x(0), oy, to_x(15), oy - gh, to_x(35), oy, outline=BG_DARK, fill="")
-        cv.create_polygon(to_x(25), oy, to_x(50), oy - gh, to_x(75), oy, outline=BG_DARK, fill="")
-        cv.create_polygon(to_x(65), oy, to_x(85), oy - gh, to_x(100), oy, outline=BG_DARK, fill="")
+        # The axis and output regions only move when the canvas is resized
+        state = self._state(cv)
+        if state['layout'] != (w, h):
+            state['layout'] = (w, h)
+            
+            # Axis
+            coords(items['axis'], ox, oy, ox + gw, oy)
+            coords(items['axis_switch'], ox, oy + 10)
+            coords(items['axis_hold'], ox + gw / 2, oy + 10)
+            coords(items['axis_keep'], ox + gw, oy + 10)
+            
+            # Output membership regions
+            for region, (left, peak, right) in zip(items['regions'], self._OUTPUT_SETS):
+                coords(region, to_x(left), oy, to_x(peak), oy - gh, to_x(right), oy)
         
         # Active fills
         switch_strength = min(r2_total, 1.5) / 1.5
         hold_strength = min(r3_total, 1.5) / 1.5
         keep_strength = min(r1_total, 1.5) / 1.5
         
-        if switch_strength > 0.05:
-            alpha_h = int(gh * switch_strength)
-            cv.create_polygon(to_x(0), oy, to_x(15), oy - alpha_h, to_x(35), oy, fill=OUT_SWITCH, outline="")
-        if hold_strength > 0.05:
-            alpha_h = int(gh * hold_strength)
-            cv.create_polygon(to_x(25), oy, to_x(50), oy - alpha_h, to_x(75), oy, fill=OUT_HOLD, outline="")
-        if keep_strength > 0.05:
-            alpha_h = int(gh * keep_strength)
-            cv.create_polygon(to_x(65), oy, to_x(85), oy - alpha_h, to_x(100), oy, fill=OUT_KEEP, outline="")
+        for fill, strength, (left, peak, right) in zip(
+                items['fills'], (switch_strength, hold_strength, keep_strength), self._OUTPUT_SETS):
+            if strength > 0.05:
+                alpha_h = int(gh * strength)
+                coords(fill, to_x(left), oy, to_x(peak), oy - alpha_h, to_x(right), oy)
+                itemconfig(fill, state='normal')
+            else:
+                itemconfig(fill, state='hidden')
         
         # Threshold line
         tx = to_x(threshold)
-        cv.create_line(tx, oy, tx, oy - gh, fill=ACCENT_PRIMARY, width=1, dash=(3, 3))
-        cv.create_text(tx, oy - gh - 5, text=f"T:{threshold:.0f}", fill=ACCENT_PRIMARY, font=theme.FONT_MINI)
+        coords(items['threshold_line'], tx, oy, tx, oy - gh)
+        coords(items['threshold_text'], tx, oy - gh - 5)
+        itemconfig(items['threshold_text'], text=f"T:{threshold:.0f}")
         
         # Score indicator
         cx = to_x(score)
-        cv.create_line(cx, oy, cx, oy - gh - 10, fill=TEXT_PRIMARY, width=3)
+        coords(items['score_line'], cx, oy, cx, oy - gh - 10)
         
         # Score color
-        score_color = get_score_color(score)
-        cv.create_text(cx, oy - gh - 18, text=f"{int(score)}%", fill=score_color, font=theme.FONT_SCORE)
+        coords(items['score_text'], cx, oy - gh - 18)
+        itemconfig(items['score_text'], text=f"{int(score)}%", fill=get_score_color(score))
         
         # Decision indicator
-        if score < threshold:
-            cv.create_text(ox + gw - 50, 10, text="→ SWITCH", fill=STATUS_ERROR, font=theme.FONT_LABEL_BOLD)
-        else:
-            cv.create_text(ox + gw - 50, 10, text="→ KEEP", fill=STATUS_GOOD, font=theme.FONT_LABEL_BOLD)
+        coords(items['decision'], ox + gw - 50, 10)
+        text, color = self._DECISION_SWITCH if score < threshold else self._DECISION_KEEP
+        itemconfig(items['decision'], text=text, fill=color)
@@ -1,6 +1,5 @@
 import tkinter as tk
 from tkinter import ttk
-import theme
 from theme import (
     BG_SIDEBAR, BG_DARK, ACCENT_PRIMARY, TEXT_MUTED,
     FONT_HEADING, FONT_LABEL, FONT_VALUE_MEDIUM, FONT_TINY,
@@ -74,41 +73,12 @@ class SettingsWindow(tk.Toplevel):
     def apply_settings(self):
         """Apply font scale and refresh the UI"""
         scale = self.font_scale.get() / 100.0
+        # Also rescales the static FONT_* tuples and the padding
         set_font_scale(scale)
         
-        # Update the static font tuples in the theme module
-        self._update_theme_fonts(scale)
-        
         # Close settings window first
         self.destroy()
         
         # Rebuild the sidebar UI
         if hasattr(self.parent, 'rebuild_sidebar'):
             self.parent.rebuild_sidebar()
-    
-    def _update_theme_fonts(self, scale):
-        """Update the static font tuples in theme module"""
-        def scaled(base_size, bold=False):
-            size = max(6, int(base_size * scale))
-            if bold:
-                return (theme.FONT_FAMILY, size, "bold")
-            return (theme.FONT_FAMILY, size)
-        
-        # Update all font constants
-        theme.FONT_TITLE = scaled(14, bold=True)
-        theme.FONT_HEADING = scaled(12, bold=True)
-        theme.FONT_NORMAL = scaled(10)
-        theme.FONT_SMALL = scaled(9)
-        theme.FONT_TINY = scaled(8)
-        theme.FONT_MINI = scaled(7)
-        theme.FONT_MICRO = scaled(6)
-        theme.FONT_VALUE_LARGE = scaled(20, bold=True)
-        theme.FONT_VALUE_MEDIUM = scaled(12, bold=True)
-        theme.FONT_VALUE_SMALL = scaled(10, bold=True)
-        theme.FONT_LABEL = scaled(9)
-        theme.FONT_LABEL_BOLD = scaled(9, bold=True)
-        theme.FONT_SCORE = scaled(11, bold=True)
-        theme.FONT_STATUS = scaled(8, bold=True)
-        
-        # Update padding to scale with fonts
-        theme.update_padding_scale()
@@ -0,0 +1,71 @@
+import unittest
+
+from app import LOS_GRADES, LaneWaitStats, UltimateTrafficApp
+
+
+def los_grade_reference(avg_delay):
+    """The original if-chain get_los_grade replaced"""
+    if avg_delay <= 10: return LOS_GRADES[0]
+    if avg_delay <= 20: return LOS_GRADES[1]
+    if avg_delay <= 35: return LOS_GRADES[2]
+    if avg_delay <= 55: return LOS_GRADES[3]
+    if avg_delay <= 80: return LOS_GRADES[4]
+    return LOS_GRADES[5]
+
+
+class LosGradeTests(unittest.TestCase):
+
+    def test_matches_reference(self):
+        # get_los_grade does not touch the app, so no Tk root is needed
+        for tenths in range(-10, 1000):
+            delay = tenths / 10
+            self.assertEqual(UltimateTrafficApp.get_los_grade(None, delay), los_grade_reference(delay), delay)
+
+    def test_threshold_is_inclusive(self):
+        self.assertEqual(UltimateTrafficApp.get_los_grade(None, 10)[0], 'A')
+        self.assertEqual(UltimateTrafficApp.get_los_grade(None, 10.01)[0], 'B')
+        self.assertEqual(UltimateTrafficApp.get_los_grade(None, 80)[0], 'E')
+        self.assertEqual(UltimateTrafficApp.get_los_grade(None, 80.01)[0], 'F')
+
+
+class LaneWaitStatsTests(unittest.TestCase):
+
+    def test_empty(self):
+        stats = LaneWaitStats()
+        self.assertEqual(stats.mean, 0)
+        self.assertEqual(stats.max, 0)
+        self.assertFalse(stats.prune(100))
+
+    def test_mean_over_last_cars(self):
+        stats = LaneWaitStats(size=3)
+        waits = [4.0, 1.0, 7.0, 2.0, 9.0]
+        for i, wait in enumerate(waits):
+            stats.record(i, wait)
+            recent = waits[max(0, i - 2):i + 1]
+            self.assertAlmostEqual(stats.mean, sum(recent) / len(recent))
+
+    def test_window_max_matches_scan(self):
+        stats = LaneWaitStats()
+        history = []
+        waits = [3.0, 8.0, 2.0, 8.0, 5.0, 1.0, 6.0, 0.5, 4.0, 7.0, 2.5]
+        for now, wait in enumerate(waits):
+            stats.record(now, wait)
+            history.append((now, wait))
+            cutoff = now - 3
+            history = [entry for entry in history if entry[0] >= cutoff]
+            stats.prune(cutoff)
+            self.assertEqual(stats.max, max(w for _, w in history), now)
+
+    def test_prune_reports_drops(self):
+        stats = LaneWaitStats()
+        stats.record(1.0, 5.0)
+        stats.record(2.0, 3.0)
+        self.assertFalse(stats.prune(1.0))
+        self.assertTrue(stats.prune(1.5))
+        self.assertEqual(stats.max, 3.0)
+        self.assertTrue(stats.prune(10))
+        self.assertEqual(stats.max, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
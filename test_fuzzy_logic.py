@@ -0,0 +1,53 @@
+import unittest
+
+from fuzzy_logic import FuzzyLogicController
+
+# (active_q, max_waiting_q, max_wait_time) -> (score, rules), computed with
+# the controller before the rule evaluation was cached and restructured
+BASELINE = (
+    ((0, 0, 0.0), 0, (0.0,) * 10),
+    ((3, 12, 20.0), 14.990630855715178, (0.0, 0.0, 0.0, 0.0, 1.6, 0.0, 0.0, 0.0, 0.0, 0.0)),
+    ((15, 9, 8527 / 60), 56.930813789962144, (0.0, 1.3, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.3)),
+    ((8, 8, 45.5), 90.64932656089489, (0.0, 0.975, 0.0, 0.0, 0.0, 0.025257142857, 0.0, 0.0, 0.0, 0.975)),
+    ((25, 2, 0.5), 100, (2.7, 0.0, 2.08, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 2.7)),
+    ((2.5, 7.5, 12.25), 14.985430831136396, (0.0, 0.0, 0.0, 0.0, 1.028571428571, 0.0, 0.0, 0.0, 0.0, 0.0)),
+    ((40, 60, 300.0), 0, (0.0,) * 10),
+)
+
+
+class CalculateBaselineTests(unittest.TestCase):
+
+    def setUp(self):
+        self.fuzzy = FuzzyLogicController()
+
+    def assert_baseline(self):
+        for args, score, rules in BASELINE:
+            result = self.fuzzy.calculate(*args, 1.0)
+            self.assertAlmostEqual(result[0], score, places=9, msg=args)
+            for got, want in zip(result[5], rules):
+                self.assertAlmostEqual(got, want, places=9, msg=args)
+
+    def test_matches_baseline(self):
+        self.assert_baseline()
+
+    def test_cached_results_match_baseline(self):
+        # Second pass is served from the _evaluate cache
+        self.assert_baseline()
+        self.assert_baseline()
+
+    def test_clear_cache_keeps_results(self):
+        self.assert_baseline()
+        self.fuzzy.clear_cache()
+        self.assert_baseline()
+
+    def test_last_inputs_follow_latest_call(self):
+        first = self.fuzzy.calculate(3, 12, 20.0, 1.0)
+        inputs = self.fuzzy.last_inputs
+        self.fuzzy.calculate(15, 9, 30.0, 1.0)
+        self.assertNotEqual(self.fuzzy.last_inputs, inputs)
+        self.assertEqual(self.fuzzy.calculate(3, 12, 20.0, 1.0)[0], first[0])
+        self.assertEqual(self.fuzzy.last_inputs, inputs)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import math
+import unittest
+
+from theme import ACCENT_PRIMARY, STATUS_WARNING, STATUS_ERROR, get_capacity_color
+
+
+def capacity_color_reference(target_flow, theoretical_capacity):
+    """The original if/elif chain get_capacity_color replaced"""
+    if target_flow > theoretical_capacity * 1.2:
+        return STATUS_ERROR
+    elif target_flow > theoretical_capacity * 0.9:
+        return STATUS_WARNING
+    else:
+        return ACCENT_PRIMARY
+
+
+class CapacityColorTests(unittest.TestCase):
+    """The bisect lookup must pick the same band as the plain comparisons"""
+
+    def test_band_edges(self):
+        for cap in (1, 7, 30, 57, 123.4):
+            self.assertEqual(get_capacity_color(cap * 0.9, cap), ACCENT_PRIMARY)
+            self.assertEqual(get_capacity_color(cap * 1.2, cap), STATUS_WARNING)
+            self.assertEqual(get_capacity_color(math.nextafter(cap * 1.2, math.inf), cap), STATUS_ERROR)
+
+    def test_matches_reference(self):
+        for cap in (0, 0.5, 1, 7, 30, 57, 123.4, 1800):
+            for tenths in range(-10, 300):
+                target = cap * tenths / 100
+                self.assertEqual(get_capacity_color(target, cap), capacity_color_reference(target, cap),
+                                 (target, cap))
+
+    def test_non_finite_input(self):
+        for target, cap in ((math.nan, 30), (30, math.nan), (math.inf, 30), (-math.inf, 30), (30, math.inf)):
+            self.assertEqual(get_capacity_color(target, cap), capacity_color_reference(target, cap),
+                             (target, cap))
+
+
+if __name__ == '__main__':
+    unittest.main()
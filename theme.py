@@ -2,6 +2,12 @@
 # THEME.PY - Centralized Color and Style Definitions (Muted Dark Mode)
 # =============================================================================
 
+import sys
+from bisect import bisect_left
+from functools import lru_cache
+from types import MappingProxyType
+from typing import NamedTuple
+
 # -----------------------------------------------------------------------------
 # BASE PALETTE - Softer, less harsh dark tones
 # -----------------------------------------------------------------------------
@@ -105,15 +111,35 @@ OVERFLOW_QUEUE = "#7a6a8a"  # Muted lavender
 # FONTS - Using Segoe UI for consistency across all UI elements
 # -----------------------------------------------------------------------------
 # Font Family
-FONT_FAMILY = "Segoe UI"
+FONT_FAMILY = sys.intern("Segoe UI")
+
+class FontSpec(NamedTuple):
+    """A Tk font description; still a plain (family, size, weight) tuple to Tk"""
+    family: str
+    size: int
+    weight: str = "normal"
 
 # Font Scale (can be modified at runtime)
 _font_scale = 1.0
 
 def set_font_scale(scale):
-    """Set the global font scale (1.0 = 100%)"""
+    """Set the global font scale (1.0 = 100%)
+
+    Updates the font getters, the static FONT_* tuples and the padding
+    together, so no caller sees a half-applied scale.
+    """
     global _font_scale
+    if scale == _font_scale:
+        return
     _font_scale = scale
+    _scaled_font_cached.cache_clear()
+    _rebuild_font_cache()
+    # Fonts for the old sizes are released (Tk deletes each one once no
+    # widget uses it); rebuilt widgets ask get_font for the new specs
+    _font_cache.clear()
+    # The static FONT_* tuples follow the scale too (FONT_TITLE <- 'title', ...)
+    globals().update(('FONT_' + key.upper(), spec) for key, spec in _FONT_CACHE.items())
+    update_padding_scale()
 
 def get_font_scale():
     """Get the current font scale"""
@@ -121,10 +147,15 @@ def get_font_scale():
 
 def scaled_font(base_size, bold=False):
     """Create a scaled font tuple"""
-    size = max(6, int(base_size * _font_scale))
+    return _scaled_font_cached(base_size, bold, _font_scale)
+
+@lru_cache(maxsize=128)
+def _scaled_font_cached(base_size, bold, scale):
+    # One FontSpec per (size, weight, scale), shared by every caller
+    size = max(6, int(base_size * scale))
     if bold:
-        return (FONT_FAMILY, size, "bold")
-    return (FONT_FAMILY, size)
+        return FontSpec(FONT_FAMILY, size, "bold")
+    return FontSpec(FONT_FAMILY, size)
 
 # Base font sizes (before scaling)
 _BASE_TITLE = 14
@@ -141,48 +172,119 @@ _BASE_LABEL = 9
 _BASE_SCORE = 11
 _BASE_STATUS = 8
 
+# (base size, bold) behind each font getter
+_FONT_BASES = {
+    'title': (_BASE_TITLE, True),
+    'heading': (_BASE_HEADING, True),
+    'normal': (_BASE_NORMAL, False),
+    'small': (_BASE_SMALL, False),
+    'tiny': (_BASE_TINY, False),
+    'mini': (_BASE_MINI, False),
+    'micro': (_BASE_MICRO, False),
+    'value_large': (_BASE_VALUE_LARGE, True),
+    'value_medium': (_BASE_VALUE_MEDIUM, True),
+    'value_small': (_BASE_VALUE_SMALL, True),
+    'label': (_BASE_LABEL, False),
+    'label_bold': (_BASE_LABEL, True),
+    'score': (_BASE_SCORE, True),
+    'status': (_BASE_STATUS, True),
+}
+
+# Scaled font per getter; rebuilt only when the scale changes
+_FONT_CACHE = {}
+
+def _rebuild_font_cache():
+    for key, (base_size, bold) in _FONT_BASES.items():
+        _FONT_CACHE[key] = scaled_font(base_size, bold)
+
+_rebuild_font_cache()
+
 # Font getter functions (use these for dynamic scaling)
-def get_font_title(): return scaled_font(_BASE_TITLE, bold=True)
-def get_font_heading(): return scaled_font(_BASE_HEADING, bold=True)
-def get_font_normal(): return scaled_font(_BASE_NORMAL)
-def get_font_small(): return scaled_font(_BASE_SMALL)
-def get_font_tiny(): return scaled_font(_BASE_TINY)
-def get_font_mini(): return scaled_font(_BASE_MINI)
-def get_font_micro(): return scaled_font(_BASE_MICRO)
-def get_font_value_large(): return scaled_font(_BASE_VALUE_LARGE, bold=True)
-def get_font_value_medium(): return scaled_font(_BASE_VALUE_MEDIUM, bold=True)
-def get_font_value_small(): return scaled_font(_BASE_VALUE_SMALL, bold=True)
-def get_font_label(): return scaled_font(_BASE_LABEL)
-def get_font_label_bold(): return scaled_font(_BASE_LABEL, bold=True)
-def get_font_score(): return scaled_font(_BASE_SCORE, bold=True)
-def get_font_status(): return scaled_font(_BASE_STATUS, bold=True)
-
-# Static font tuples (for backwards compatibility - these won't scale dynamically)
+def get_font_title(): return _FONT_CACHE['title']
+def get_font_heading(): return _FONT_CACHE['heading']
+def get_font_normal(): return _FONT_CACHE['normal']
+def get_font_small(): return _FONT_CACHE['small']
+def get_font_tiny(): return _FONT_CACHE['tiny']
+def get_font_mini(): return _FONT_CACHE['mini']
+def get_font_micro(): return _FONT_CACHE['micro']
+def get_font_value_large(): return _FONT_CACHE['value_large']
+def get_font_value_medium(): return _FONT_CACHE['value_medium']
+def get_font_value_small(): return _FONT_CACHE['value_small']
+def get_font_label(): return _FONT_CACHE['label']
+def get_font_label_bold(): return _FONT_CACHE['label_bold']
+def get_font_score(): return _FONT_CACHE['score']
+def get_font_status(): return _FONT_CACHE['status']
+
+# Font tuples at the current scale: set_font_scale() rebinds these names, so
+# read them as theme.FONT_* to follow it. Modules that copied them with
+# 'from theme import FONT_*' (app.py, settings.py) keep the import-time values
 # Section Headers
-FONT_TITLE = (FONT_FAMILY, 14, "bold")        # Main section headers
-FONT_HEADING = (FONT_FAMILY, 12, "bold")      # Sub-section headers
+FONT_TITLE = FontSpec(FONT_FAMILY, 14, "bold")        # Main section headers
+FONT_HEADING = FontSpec(FONT_FAMILY, 12, "bold")      # Sub-section headers
 
 # Body Text
-FONT_NORMAL = (FONT_FAMILY, 10)               # Standard text
-FONT_SMALL = (FONT_FAMILY, 9)                 # Smaller body text
+FONT_NORMAL = FontSpec(FONT_FAMILY, 10)               # Standard text
+FONT_SMALL = FontSpec(FONT_FAMILY, 9)                 # Smaller body text
 
 # Graph/Canvas Text
-FONT_TINY = (FONT_FAMILY, 8)                  # Graph titles, axis labels
-FONT_MINI = (FONT_FAMILY, 7)                  # Small graph labels
-FONT_MICRO = (FONT_FAMILY, 6)                 # Smallest text (membership values)
+FONT_TINY = FontSpec(FONT_FAMILY, 8)                  # Graph titles, axis labels
+FONT_MINI = FontSpec(FONT_FAMILY, 7)                  # Small graph labels
+FONT_MICRO = FontSpec(FONT_FAMILY, 6)                 # Smallest text (membership values)
 
 # Value Displays (Numbers)
-FONT_VALUE_LARGE = (FONT_FAMILY, 20, "bold")  # Main metric values
-FONT_VALUE_MEDIUM = (FONT_FAMILY, 12, "bold") # Secondary values
-FONT_VALUE_SMALL = (FONT_FAMILY, 10, "bold")  # Small value displays
+FONT_VALUE_LARGE = FontSpec(FONT_FAMILY, 20, "bold")  # Main metric values
+FONT_VALUE_MEDIUM = FontSpec(FONT_FAMILY, 12, "bold") # Secondary values
+FONT_VALUE_SMALL = FontSpec(FONT_FAMILY, 10, "bold")  # Small value displays
 
 # Labels
-FONT_LABEL = (FONT_FAMILY, 9)                 # Form labels
-FONT_LABEL_BOLD = (FONT_FAMILY, 9, "bold")    # Bold labels
+FONT_LABEL = FontSpec(FONT_FAMILY, 9)                 # Form labels
+FONT_LABEL_BOLD = FontSpec(FONT_FAMILY, 9, "bold")    # Bold labels
 
 # Special
-FONT_SCORE = (FONT_FAMILY, 11, "bold")        # Fuzzy score display
-FONT_STATUS = (FONT_FAMILY, 8, "bold")        # Status indicators
+FONT_SCORE = FontSpec(FONT_FAMILY, 11, "bold")        # Fuzzy score display
+FONT_STATUS = FontSpec(FONT_FAMILY, 8, "bold")        # Status indicators
+
+# Named Tk fonts mirroring the tuples above. Widgets can pass the name
+# (e.g. font='Title.Font') so Tk resolves the font once, not per widget.
+NAMED_FONTS = {
+    'Title.Font': 'FONT_TITLE',
+    'Normal.Font': 'FONT_NORMAL',
+    'Small.Font': 'FONT_SMALL',
+    'Tiny.Font': 'FONT_TINY',
+    'LabelBold.Font': 'FONT_LABEL_BOLD',
+}
+_named_fonts = {}  # Keeps the Font objects alive (Tk deletes them on GC)
+
+def register_named_fonts(root):
+    """Create the NAMED_FONTS in Tk, or update them to the current FONT_* sizes"""
+    import tkinter.font as tkfont
+    for name, attr in NAMED_FONTS.items():
+        family, size, *style = globals()[attr]
+        weight = "bold" if "bold" in style else "normal"
+        font = _named_fonts.get(name)
+        if font is None:
+            _named_fonts[name] = tkfont.Font(root, name=name, family=family, size=size, weight=weight)
+        else:
+            font.configure(family=family, size=size, weight=weight)
+
+_font_cache = {}  # Shared Font objects by spec tuple; cleared by set_font_scale
+
+def get_font(spec):
+    """Return a shared tkinter Font for a FONT_* tuple, created on first use.
+
+    Widgets given the Font reference one Tk font by name instead of each
+    parsing the tuple into a font of their own. Needs a Tk root to exist.
+    """
+    font = _font_cache.get(spec)
+    if font is None:
+        import tkinter.font as tkfont
+        family, size, *style = spec
+        font = _font_cache[spec] = tkfont.Font(
+            family=family, size=size,
+            weight="bold" if "bold" in style else "normal",
+            underline="underline" in style,
+        )
+    return font
 
 # -----------------------------------------------------------------------------
 # STYLE CONSTANTS
@@ -248,14 +350,18 @@ def get_efficiency_color(efficiency):
 # -----------------------------------------------------------------------------
 # HELPER FUNCTION - Get color for flow status
 # -----------------------------------------------------------------------------
+_FLOW_CONGESTED = ("⚠ Congested", STATUS_ERROR)
+_FLOW_BUILDING = ("~ Building", STATUS_WARNING)
+_FLOW_FLOWING = ("✓ Flowing", STATUS_GOOD)
+
 def get_flow_status(current_flow, target_flow):
     """Return status text, color based on flow ratio"""
     if current_flow < target_flow * 0.5:
-        return "⚠ Congested", STATUS_ERROR
+        return _FLOW_CONGESTED
     elif current_flow >= target_flow * 0.9:
-        return "✓ Flowing", STATUS_GOOD
+        return _FLOW_FLOWING
     else:
-        return "~ Building", STATUS_WARNING
+        return _FLOW_BUILDING
 
 # -----------------------------------------------------------------------------
 # HELPER FUNCTION - Get color for score region
@@ -272,14 +378,13 @@ def get_score_color(score):
 # -----------------------------------------------------------------------------
 # HELPER FUNCTION - Get capacity warning color
 # -----------------------------------------------------------------------------
-def get_capacity_color(target_flow, theoretical_capacity):
+# Under capacity - OK, near capacity, over capacity - will congest
+_CAPACITY_COLORS = (ACCENT_PRIMARY, STATUS_WARNING, STATUS_ERROR)
+
+def get_capacity_color(target_flow, theoretical_capacity, *, _colors=_CAPACITY_COLORS, _bisect=bisect_left):
     """Return color based on demand vs capacity"""
-    if target_flow > theoretical_capacity * 1.2:
-        return STATUS_ERROR      # Over capacity - will congest
-    elif target_flow > theoretical_capacity * 0.9:
-        return STATUS_WARNING    # Near capacity
-    else:
-        return ACCENT_PRIMARY    # Under capacity - OK
+    # bisect_left: demand exactly at an edge stays in the lower band
+    return _colors[_bisect((theoretical_capacity * 0.9, theoretical_capacity * 1.2), target_flow)]
 
 # -----------------------------------------------------------------------------
 # HELPER FUNCTION - Get gauge bar color
@@ -292,3 +397,92 @@ def get_gauge_bar_color(current_flow, target_flow):
         return STATUS_WARNING    # Partial
     else:
         return STATUS_ERROR      # Congested
+
+# -----------------------------------------------------------------------------
+# TTK STYLES
+# -----------------------------------------------------------------------------
+# ttk style name -> configure() options. A 'font' is either the name of a
+# FONT_* tuple (resolved at apply time, so it follows the font scale), a
+# (FONT_* name, extra style...) tuple, or a named Tk font such as 'Title.Font'
+STYLE_SPEC = MappingProxyType({
+    # Frames
+    'TFrame': {'background': BG_SIDEBAR},
+    'Dark.TFrame': {'background': BG_DARK},
+    'Viz.TFrame': {'background': 'black', 'relief': 'sunken', 'borderwidth': 2},
+    # PanedWindow
+    'TPanedwindow': {'background': BG_MAIN},
+    # Labels
+    'TLabel': {'background': BG_SIDEBAR, 'foreground': TEXT_PRIMARY, 'font': 'FONT_NORMAL'},
+    'Dark.TLabel': {'background': BG_DARK, 'foreground': TEXT_PRIMARY, 'font': 'FONT_LABEL_BOLD'},
+    'Header.TLabel': {'background': BG_DARK, 'foreground': TEXT_MUTED, 'font': 'FONT_LABEL_BOLD'},
+    'Primary.TLabel': {'background': BG_SIDEBAR, 'foreground': ACCENT_PRIMARY, 'font': 'FONT_LABEL'},
+    'Demand.TLabel': {'background': BG_SIDEBAR, 'foreground': GAUGE_DEMAND_LINE, 'font': 'FONT_LABEL'},
+    'RealWorld.TLabel': {'background': BG_SIDEBAR, 'foreground': ACCENT_TERTIARY, 'font': 'FONT_LABEL'},
+    'Value.Primary.TLabel': {'background': BG_SIDEBAR, 'foreground': ACCENT_PRIMARY, 'font': 'FONT_VALUE_MEDIUM'},
+    'Value.Demand.TLabel': {'background': BG_SIDEBAR, 'foreground': GAUGE_DEMAND_LINE, 'font': 'FONT_VALUE_MEDIUM'},
+    'Value.RealWorld.TLabel': {'background': BG_SIDEBAR, 'foreground': ACCENT_TERTIARY, 'font': 'FONT_VALUE_MEDIUM'},
+    'Status.TLabel': {'background': BG_SIDEBAR, 'foreground': TEXT_MUTED, 'font': 'FONT_STATUS'},
+    'Overall.Status.TLabel': {'background': BG_DARK, 'foreground': TEXT_MUTED, 'font': 'FONT_STATUS'},
+    'Small.TLabel': {'background': BG_SIDEBAR, 'foreground': TEXT_PRIMARY, 'font': 'FONT_VALUE_SMALL'},
+    'Small.Muted.TLabel': {'background': BG_SIDEBAR, 'foreground': TEXT_MUTED, 'font': 'FONT_VALUE_SMALL'},
+    'LOS.TLabel': {'background': BG_SIDEBAR, 'font': 'FONT_VALUE_MEDIUM'},
+    'Overall.LOS.TLabel': {'background': BG_DARK, 'font': 'FONT_VALUE_LARGE'},
+    'Section.TLabel': {'background': BG_SIDEBAR, 'foreground': TEXT_SECONDARY, 'font': 'FONT_LABEL'},
+    # About window labels
+    'Title.TLabel': {'background': BG_SIDEBAR, 'foreground': ACCENT_PRIMARY, 'font': 'Title.Font'},
+    'Desc.TLabel': {'background': BG_SIDEBAR, 'foreground': TEXT_PRIMARY, 'font': 'Normal.Font', 'wraplength': 350, 'justify': 'center'},
+    'Muted.TLabel': {'background': BG_SIDEBAR, 'foreground': TEXT_MUTED, 'font': 'Small.Font'},
+    'Bold.TLabel': {'background': BG_SIDEBAR, 'foreground': TEXT_PRIMARY, 'font': 'LabelBold.Font'},
+    'Caption.TLabel': {'background': BG_SIDEBAR, 'foreground': TEXT_PRIMARY, 'font': 'Tiny.Font'},
+    'Link.TLabel': {'background': BG_SIDEBAR, 'foreground': ACCENT_PRIMARY, 'font': ('FONT_SMALL', 'underline')},
+    # Button
+    'TButton': {'font': 'FONT_LABEL_BOLD', 'foreground': TEXT_PRIMARY},
+    # Scale
+    'Horizontal.TScale': {'background': BG_SIDEBAR},
+    # Notebook (Tabs)
+    'TNotebook': {'background': BG_MAIN, 'borderwidth': 0},
+    'TNotebook.Tab': {'background': BG_DARK, 'foreground': TEXT_MUTED, 'font': 'FONT_LABEL_BOLD', 'padding': (12, 6)},
+})
+
+# ttk style name -> map() options (state-dependent values)
+STYLE_MAP = MappingProxyType({
+    'TPanedwindow.Sash': {'background': [('!active', BG_MAIN)], 'troughcolor': [('!active', BG_MAIN)]},
+    'TButton': {'background': [('!active', ACCENT_SECONDARY), ('active', ACCENT_PRIMARY)]},
+    'TNotebook.Tab': {
+        'background': [('selected', BG_SIDEBAR), ('!selected', BG_DARK)],
+        'foreground': [('selected', ACCENT_PRIMARY), ('!selected', TEXT_MUTED)],
+    },
+})
+
+def _resolve_font(font):
+    """Turn a STYLE_SPEC font entry into something ttk accepts"""
+    if isinstance(font, tuple):
+        name, *extra = font
+        return get_font(globals()[name] + tuple(extra))
+    if font.startswith('FONT_'):
+        return get_font(globals()[font])
+    return font  # Named Tk font
+
+def apply_theme(style, spec=STYLE_SPEC, style_map=STYLE_MAP):
+    """Configure a ttk.Style from STYLE_SPEC and STYLE_MAP at the current font scale"""
+    configure = style.configure
+    for name, options in spec.items():
+        font = options.get('font')
+        if font is not None:
+            options = {**options, 'font': _resolve_font(font)}
+        configure(name, **options)
+    for name, options in style_map.items():
+        style.map(name, **options)
+
+# What was last applied per Tk interpreter (ttk styles are per interpreter,
+# not per ttk.Style object): (spec, style_map, font scale)
+_applied_themes = {}
+
+def apply_theme_if_changed(style, spec=STYLE_SPEC, style_map=STYLE_MAP):
+    """apply_theme(), skipped when the same spec is already applied at this scale"""
+    key = (id(spec), id(style_map), _font_scale)
+    if _applied_themes.get(style.tk) == key:
+        return False
+    apply_theme(style, spec, style_map)
+    _applied_themes[style.tk] = key
+    return True